@@ -3,93 +3,326 @@ Build script for creating KeyVisualizer standalone executable.
 Uses PyInstaller to package the application.
 
 Usage:
-    python build_exe.py
+    python build_exe.py [--force] [--fresh]
 
-The executable will be created in the 'dist' folder.
+The executable will be created in the 'dist' folder and PyInstaller is
+skipped when it is already up to date; pass --force to rebuild anyway.
+Builds are incremental by default (PyInstaller reuses its cache in
+'.pyinstaller-cache'); pass --fresh to wipe the cache first, e.g. for
+release builds. Set FAST_BUILD=1 to skip UPX compression during development.
+
+build_installer.py imports build() from here for its first step.
 """
 import os
 import sys
+import hashlib
+import locale
 import subprocess
+import pkgutil
+import importlib.util
 import shutil
+import sysconfig
+import threading
+from pathlib import Path
 
 APP_NAME = "KeyVisualizer"
 MAIN_SCRIPT = "keyVisualizer.py"
 ICON_FILE = "keyvisualizer.ico"  # Optional, will be used if present
+CACHE_DIR = ".pyinstaller-cache"  # Stable work directory, cacheable in CI
+SPEC_HASH_FILE = os.path.join(CACHE_DIR, "spec_hash.txt")
+BUILD_HASH_FILE = os.path.join(CACHE_DIR, "build_hash.txt")
+# Files besides the main script that determine whether the exe needs rebuilding
+EXTRA_BUILD_INPUTS = ["requirements.txt", ICON_FILE]
+# Child tools write in the system code page; undecodable bytes are replaced
+# so a localized message can't break the output stream
+OUTPUT_ENCODING = locale.getpreferredencoding(False)
+# Module fallbacks for the PyInstaller launchers
+PYINSTALLER_MODULES = {
+    "pyinstaller": "PyInstaller",
+    "pyi-makespec": "PyInstaller.utils.cliutils.makespec",
+}
 
 
-def main():
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    os.chdir(script_dir)
+# PyQt6 modules used by the app (discovered normally, listed for safety)
+QT_HIDDEN_IMPORTS = ["PyQt6.QtWidgets", "PyQt6.QtCore", "PyQt6.QtGui"]
+# Used if pynput can't be found for auto-discovery
+PYNPUT_FALLBACK_IMPORTS = [
+    "pynput.keyboard",
+    "pynput.keyboard._win32",
+    "pynput.mouse",
+    "pynput.mouse._win32",
+    "pynput._util",
+    "pynput._util.win32",
+]
+# pynput backend modules are named after their platform (_win32, win32_vks, ...)
+PLATFORM_BACKENDS = {"win32": ("win32",), "darwin": ("darwin",)}
+ALL_BACKENDS = ("win32", "darwin", "xorg", "uinput")
+
+
+def _is_foreign_backend(module_name):
+    """True if module_name is a pynput backend for another platform."""
+    leaf = module_name.rsplit(".", 1)[-1].lstrip("_")
+    ours = PLATFORM_BACKENDS.get(sys.platform, ("xorg", "uinput"))
+    return leaf.startswith(ALL_BACKENDS) and not leaf.startswith(ours)
+
+
+def discover_hidden_imports(package):
+    """List a package and all its submodules without importing them."""
+    spec = importlib.util.find_spec(package)
+    if spec is None or not spec.submodule_search_locations:
+        raise ImportError(f"{package} is not an installed package")
     
-    print(f"Building {APP_NAME} executable...")
-    print(f"Working directory: {script_dir}")
+    names = [package]
     
-    # Check if PyInstaller is installed
-    try:
-        import PyInstaller
-        print(f"PyInstaller version: {PyInstaller.__version__}")
-    except ImportError:
+    def walk(paths, prefix):
+        for info in pkgutil.iter_modules(paths, prefix):
+            if _is_foreign_backend(info.name):
+                continue
+            names.append(info.name)
+            if info.ispkg:
+                leaf = info.name.rsplit(".", 1)[-1]
+                walk([os.path.join(info.module_finder.path, leaf)], info.name + ".")
+    
+    walk(spec.submodule_search_locations, package + ".")
+    return names
+
+
+def find_pyinstaller(tool="pyinstaller"):
+    """Return the command prefix for one of this interpreter's PyInstaller tools.
+    
+    Prefers the launcher next to this interpreter, which avoids importing
+    PyInstaller here; installs PyInstaller if it is missing.
+    """
+    scripts_dir = sysconfig.get_path("scripts")
+    launcher = shutil.which(tool, path=scripts_dir)
+    if launcher:
+        return [launcher]
+    
+    if importlib.util.find_spec("PyInstaller") is None:
         print("PyInstaller not found. Installing...")
         subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
+        launcher = shutil.which(tool, path=scripts_dir)
+        if launcher:
+            return [launcher]
     
-    # Build PyInstaller command
-    cmd = [
-        sys.executable, "-m", "PyInstaller",
-        "--name", APP_NAME,
+    return [sys.executable, "-m", PYINSTALLER_MODULES[tool]]
+
+
+def hash_options(spec_options):
+    """Return a SHA-256 over a list of makespec arguments."""
+    return hashlib.sha256("\0".join(spec_options).encode()).hexdigest()
+
+
+def ensure_spec(spec_file, spec_options):
+    """Generate spec_file with pyi-makespec unless it is already current.
+    
+    spec_options are the makespec arguments. Their hash is stored with the
+    PyInstaller cache, so an unchanged spec is reused as-is and PyInstaller
+    can keep its cached analysis.
+    """
+    options_hash = hash_options(spec_options)
+    try:
+        with open(SPEC_HASH_FILE) as f:
+            stored_hash = f.read().strip()
+    except OSError:
+        stored_hash = None
+    
+    if os.path.exists(spec_file) and stored_hash == options_hash:
+        print(f"Using existing {spec_file}")
+        return spec_file
+    
+    print(f"Generating {spec_file}...")
+    subprocess.check_call(find_pyinstaller("pyi-makespec") + spec_options)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(SPEC_HASH_FILE, "w") as f:
+        f.write(options_hash)
+    return spec_file
+
+
+def compute_build_hash(build_inputs, options_hash):
+    """Return a SHA-256 over the build options and the inputs that exist."""
+    digest = hashlib.sha256(options_hash.encode())
+    for name in build_inputs:
+        if os.path.exists(name):
+            digest.update(name.encode())
+            with open(name, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def read_build_record():
+    """Return (options_hash, build_hash) recorded by the last successful build.
+    
+    Both are None if no build has been recorded yet.
+    """
+    try:
+        with open(BUILD_HASH_FILE) as f:
+            options_hash, build_hash = f.read().split()
+    except (OSError, ValueError):
+        return None, None
+    return options_hash, build_hash
+
+
+def default_hidden_imports():
+    """PyQt6 modules plus every pynput submodule for this platform."""
+    # pynput selects its platform backend at runtime, so PyInstaller can't see it
+    hidden_imports = list(QT_HIDDEN_IMPORTS)
+    try:
+        hidden_imports += discover_hidden_imports("pynput")
+    except ImportError:
+        print("pynput not found, using the built-in hidden import list")
+        hidden_imports += PYNPUT_FALLBACK_IMPORTS
+    return hidden_imports
+
+
+def stream_output(proc):
+    """Echo a child process's combined stdout/stderr as it arrives."""
+    for line in proc.stdout:
+        print(line, end="", flush=True)
+
+
+def build(app_name=APP_NAME, main_script=MAIN_SCRIPT, hidden_imports=None,
+          clean=False, force=False, workpath=None):
+    """Build the executable with PyInstaller.
+    
+    The build is skipped when the existing executable was built with the same
+    options and is newer than all inputs or was built from identical inputs,
+    unless force or clean is set. clean also clears the PyInstaller cache.
+    Returns (exe_path, os.stat_result) so callers don't stat the exe again,
+    or None if the build failed.
+    """
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    os.chdir(script_dir)
+    
+    exe_name = f"{app_name}.exe" if sys.platform == "win32" else app_name
+    exe_path = Path(script_dir, "dist", exe_name)
+    if workpath is None:
+        workpath = os.path.join(CACHE_DIR, "build")
+    build_inputs = [main_script] + EXTRA_BUILD_INPUTS
+    
+    # Options baked into the spec file
+    spec_options = [
+        "--name", app_name,
         "--onefile",           # Single executable file
         "--windowed",          # No console window (GUI app)
-        "--noconfirm",         # Overwrite without asking
-        "--clean",             # Clean cache before building
     ]
     
+    # FAST_BUILD skips UPX, which otherwise recompresses the Qt DLLs every build
+    if os.environ.get("FAST_BUILD"):
+        spec_options.append("--noupx")
+        print("FAST_BUILD set: skipping UPX compression")
+    
     # Add icon if present
     icon_path = os.path.join(script_dir, ICON_FILE)
     if os.path.exists(icon_path):
-        cmd.extend(["--icon", icon_path])
+        spec_options.extend(["--icon", icon_path])
         print(f"Using icon: {icon_path}")
     else:
         print(f"No icon file found ({ICON_FILE}), building without icon")
     
-    # Hidden imports that PyInstaller might miss
-    hidden_imports = [
-        "PyQt6.QtWidgets",
-        "PyQt6.QtCore",
-        "PyQt6.QtGui",
-        "pynput.keyboard",
-        "pynput.keyboard._win32",
-        "pynput.mouse",
-        "pynput.mouse._win32",
-        "pynput._util",
-        "pynput._util.win32",
-    ]
-    for imp in hidden_imports:
-        cmd.extend(["--hidden-import", imp])
+    if hidden_imports is None:
+        hidden_imports = default_hidden_imports()
+    spec_options += [arg for imp in hidden_imports for arg in ("--hidden-import", imp)]
     
     # Add the main script
-    cmd.append(MAIN_SCRIPT)
+    spec_options.append(main_script)
+    
+    # Skip PyInstaller if the exe is up to date and was built with the same
+    # options: first by mtime (no file reads), then by the content hash
+    # recorded by the last build
+    options_hash = hash_options(spec_options)
+    stored_options_hash, stored_build_hash = read_build_record()
+    build_hash = None
+    try:
+        exe_stat = None if (force or clean) else os.stat(exe_path)
+    except OSError:
+        exe_stat = None  # Not built yet
+    if exe_stat is not None:
+        if stored_options_hash == options_hash:
+            # One directory sweep for the inputs next to this script; on
+            # Windows the mtimes come with the entries
+            input_mtimes = [
+                entry.stat().st_mtime for entry in os.scandir(script_dir)
+                if entry.name in build_inputs
+            ]
+            # Inputs given with a directory (e.g. src/app.py) are stat-ed
+            # directly; a missing one forces the content check below
+            try:
+                input_mtimes += [
+                    os.stat(name).st_mtime for name in build_inputs
+                    if os.path.basename(name) != name
+                ]
+            except OSError:
+                input_mtimes.append(float("inf"))
+            if exe_stat.st_mtime > max(input_mtimes, default=0):
+                print("Executable is newer than all inputs, skipping PyInstaller")
+                return exe_path, exe_stat
+        
+        build_hash = compute_build_hash(build_inputs, options_hash)
+        if stored_build_hash == build_hash:
+            print("Inputs unchanged since last build, reusing existing executable")
+            return exe_path, exe_stat
+    
+    spec_file = ensure_spec(f"{app_name}.spec", spec_options)
+    
+    # Build PyInstaller command
+    cmd = find_pyinstaller() + [
+        "--noconfirm",         # Overwrite without asking
+        "--workpath", workpath,
+        "--distpath", "dist",
+    ]
+    
+    # Incremental by default; clean clears the PyInstaller cache first
+    if clean:
+        cmd.append("--clean")
+        print("Fresh build: clearing PyInstaller cache")
+    
+    cmd.append(spec_file)
     
     print("\nRunning PyInstaller...")
     print(f"Command: {' '.join(cmd)}\n")
     
-    # Run PyInstaller
-    result = subprocess.run(cmd)
-    
-    if result.returncode == 0:
-        # Determine output path
-        if sys.platform == "win32":
-            exe_name = f"{APP_NAME}.exe"
-        elif sys.platform == "darwin":
-            exe_name = APP_NAME  # macOS app bundle
-        else:
-            exe_name = APP_NAME
-        
-        dist_path = os.path.join(script_dir, "dist", exe_name)
-        
+    # Run PyInstaller, streaming its output as it arrives
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=1,
+        text=True, encoding=OUTPUT_ENCODING, errors="replace"
+    )
+    reader = threading.Thread(target=stream_output, args=(proc,), daemon=True)
+    reader.start()
+    proc.wait()
+    reader.join()
+    
+    if proc.returncode != 0:
+        return None
+    try:
+        exe_stat = os.stat(exe_path)
+    except OSError:
+        return None  # PyInstaller exited cleanly but produced no exe
+    
+    # Record the options and inputs this exe was built from
+    if build_hash is None:
+        build_hash = compute_build_hash(build_inputs, options_hash)
+    with open(BUILD_HASH_FILE, "w") as f:
+        f.write(f"{options_hash}\n{build_hash}\n")
+    
+    return exe_path, exe_stat
+
+
+def main():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    
+    print(f"Building {APP_NAME} executable...")
+    print(f"Working directory: {script_dir}")
+    
+    result = build(clean="--fresh" in sys.argv, force="--force" in sys.argv)
+    
+    if result:
+        exe_path, exe_stat = result
         print("\n" + "=" * 50)
         print("BUILD SUCCESSFUL!")
         print("=" * 50)
-        print(f"\nExecutable location: {dist_path}")
-        print(f"Size: {os.path.getsize(dist_path) / (1024*1024):.1f} MB")
+        print(f"\nExecutable location: {exe_path}")
+        print(f"Size: {exe_stat.st_size / (1024*1024):.1f} MB")
         print("\nYou can now distribute this file to users.")
         print("No Python installation required to run it!")
     else:
@@ -2,7 +2,7 @@
 Build script that creates both the executable and the installer.
 
 This script:
-1. Builds the KeyVisualizer.exe using PyInstaller
+1. Builds the KeyVisualizer.exe using PyInstaller (via build_exe.build)
 2. Creates a Windows installer using Inno Setup
 
 Requirements:
@@ -10,17 +10,39 @@ Requirements:
 - Inno Setup (download from https://jrsoftware.org/isdl.php)
 
 Usage:
-    python build_installer.py
+    python build_installer.py [--force] [--fresh]
+
+The PyInstaller step is skipped when dist/KeyVisualizer.exe is already up to
+date. Pass --force to rebuild it anyway, or --fresh to also clear the
+PyInstaller cache first (release builds). Set FAST_BUILD=1 to skip UPX
+compression during development.
 """
 import os
 import sys
 import subprocess
 import shutil
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from build_exe import build, stream_output, OUTPUT_ENCODING
+
 
+@functools.lru_cache(maxsize=None)
 def check_inno_setup():
-    """Check if Inno Setup is installed and return the compiler path."""
+    """Check if Inno Setup is installed and return the compiler path.
+    
+    The ISCC environment variable overrides the search (useful in CI),
+    followed by ISCC on PATH and then the default install locations.
+    """
+    env_path = os.environ.get("ISCC")
+    if env_path and os.path.exists(env_path):
+        return env_path
+    
+    on_path = shutil.which("ISCC")
+    if on_path:
+        return on_path
+    
     # Common Inno Setup installation paths
     possible_paths = [
         r"C:\Program Files (x86)\Inno Setup 6\ISCC.exe",
@@ -36,88 +58,36 @@ def check_inno_setup():
     return None
 
 
-def build_exe():
-    """Build the executable using PyInstaller."""
-    print("=" * 60)
-    print("STEP 1: Building executable with PyInstaller")
-    print("=" * 60)
+def check_installer_files(script_dir):
+    """Check the installer inputs that don't depend on the executable.
     
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    os.chdir(script_dir)
-    
-    # Check if PyInstaller is installed
-    try:
-        import PyInstaller
-        print(f"PyInstaller version: {PyInstaller.__version__}")
-    except ImportError:
-        print("PyInstaller not found. Installing...")
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "pyinstaller"])
-    
-    # Build PyInstaller command
-    cmd = [
-        sys.executable, "-m", "PyInstaller",
-        "--name", "KeyVisualizer",
-        "--onefile",
-        "--windowed",
-        "--noconfirm",
-        "--clean",
-    ]
+    Returns a list of error messages (empty if everything is in place).
+    """
+    errors = []
     
-    # Add icon if present
-    icon_path = os.path.join(script_dir, "keyvisualizer.ico")
-    if os.path.exists(icon_path):
-        cmd.extend(["--icon", icon_path])
-        print(f"Using icon: {icon_path}")
-    else:
-        print("No icon file found (keyvisualizer.ico)")
-    
-    # Hidden imports
-    hidden_imports = [
-        "PyQt6.QtWidgets",
-        "PyQt6.QtCore",
-        "PyQt6.QtGui",
-        "pynput.keyboard",
-        "pynput.keyboard._win32",
-        "pynput.mouse",
-        "pynput.mouse._win32",
-        "pynput._util",
-        "pynput._util.win32",
-    ]
-    for imp in hidden_imports:
-        cmd.extend(["--hidden-import", imp])
+    # One directory read instead of a stat per file
+    names = {entry.name for entry in os.scandir(script_dir)}
     
-    # Add main script
-    cmd.append("keyVisualizer.py")
+    if "installer.iss" not in names:
+        iss_file = os.path.join(script_dir, "installer.iss")
+        errors.append(f"Inno Setup script not found: {iss_file}")
     
-    print("\nRunning PyInstaller...")
-    print(f"Command: {' '.join(cmd)}\n")
-    
-    result = subprocess.run(cmd)
-    
-    if result.returncode != 0:
-        print("\n" + "=" * 60)
-        print("ERROR: PyInstaller build failed!")
-        print("=" * 60)
-        sys.exit(1)
-    
-    # Check if exe was created
-    exe_path = os.path.join(script_dir, "dist", "KeyVisualizer.exe")
-    if not os.path.exists(exe_path):
-        print("\n" + "=" * 60)
-        print("ERROR: Executable was not created!")
-        print("=" * 60)
-        sys.exit(1)
+    if "LICENSE" not in names:
+        errors.append(
+            "LICENSE file not found!\n"
+            "Please ensure LICENSE file exists before building installer."
+        )
     
-    print("\n" + "=" * 60)
-    print("Executable built successfully!")
-    print(f"Location: {exe_path}")
-    print(f"Size: {os.path.getsize(exe_path) / (1024*1024):.1f} MB")
-    print("=" * 60)
-    return True
+    return errors
 
 
-def build_installer():
-    """Build the installer using Inno Setup."""
+def build_installer(exe_path, iscc_path, errors):
+    """Build the installer using Inno Setup.
+    
+    exe_path is the executable returned by build(). iscc_path and errors are
+    the results of check_inno_setup() and check_installer_files(), which
+    main() runs while the exe is built.
+    """
     print("\n" + "=" * 60)
     print("STEP 2: Building installer with Inno Setup")
     print("=" * 60)
@@ -125,7 +95,6 @@ def build_installer():
     script_dir = os.path.dirname(os.path.abspath(__file__))
     
     # Check if Inno Setup is installed
-    iscc_path = check_inno_setup()
     if not iscc_path:
         print("\nERROR: Inno Setup not found!")
         print("\nPlease install Inno Setup from:")
@@ -133,35 +102,29 @@ def build_installer():
         print("\nAfter installation, run this script again.")
         sys.exit(1)
     
-    print(f"Found Inno Setup: {iscc_path}")
-    
-    # Check if .iss file exists
-    iss_file = os.path.join(script_dir, "installer.iss")
-    if not os.path.exists(iss_file):
-        print(f"\nERROR: Inno Setup script not found: {iss_file}")
+    # Check the installer script and LICENSE
+    if errors:
+        for error in errors:
+            print(f"\nERROR: {error}")
         sys.exit(1)
     
-    # Check if exe exists
-    exe_path = os.path.join(script_dir, "dist", "KeyVisualizer.exe")
-    if not os.path.exists(exe_path):
-        print("\nERROR: KeyVisualizer.exe not found in dist folder!")
-        print("Please run build step 1 first.")
-        sys.exit(1)
+    print(f"Found Inno Setup: {iscc_path}")
     
-    # Check if LICENSE file exists
-    license_path = os.path.join(script_dir, "LICENSE")
-    if not os.path.exists(license_path):
-        print("\nERROR: LICENSE file not found!")
-        print("Please ensure LICENSE file exists before building installer.")
-        sys.exit(1)
+    iss_file = os.path.join(script_dir, "installer.iss")
+    print(f"Packaging: {exe_path}")
     
     # Run Inno Setup
     print("\nRunning Inno Setup compiler...")
     cmd = [iscc_path, iss_file]
     
-    result = subprocess.run(cmd)
+    proc = subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, bufsize=1,
+        text=True, encoding=OUTPUT_ENCODING, errors="replace"
+    )
+    stream_output(proc)
+    proc.wait()
     
-    if result.returncode != 0:
+    if proc.returncode != 0:
         print("\n" + "=" * 60)
         print("ERROR: Installer build failed!")
         print("=" * 60)
@@ -170,14 +133,13 @@ def build_installer():
     # Find the created installer
     installer_output = os.path.join(script_dir, "installer_output")
     if os.path.exists(installer_output):
-        installers = list(Path(installer_output).glob("KeyVisualizer_Setup_*.exe"))
-        if installers:
-            installer_path = installers[0]
+        installer_path = next(Path(installer_output).glob("KeyVisualizer_Setup_*.exe"), None)
+        if installer_path:
             print("\n" + "=" * 60)
             print("INSTALLER BUILD SUCCESSFUL!")
             print("=" * 60)
             print(f"\nInstaller location: {installer_path}")
-            print(f"Size: {os.path.getsize(installer_path) / (1024*1024):.1f} MB")
+            print(f"Size: {installer_path.stat().st_size / (1024*1024):.1f} MB")
             print("\nYou can now distribute this installer to users!")
             print("=" * 60)
             return True
@@ -198,12 +160,37 @@ def main():
     print("2. Create a Windows installer using Inno Setup")
     print("\n" + "=" * 60 + "\n")
     
-    # Build exe
-    if not build_exe():
-        sys.exit(1)
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    
+    # The installer checks don't depend on the exe, so run them while
+    # PyInstaller compiles
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        iscc_future = executor.submit(check_inno_setup)
+        files_future = executor.submit(check_installer_files, script_dir)
+        
+        print("=" * 60)
+        print("STEP 1: Building executable with PyInstaller")
+        print("=" * 60)
+        
+        result = build(clean="--fresh" in sys.argv, force="--force" in sys.argv)
+        if result is None:
+            print("\n" + "=" * 60)
+            print("ERROR: PyInstaller build failed!")
+            print("=" * 60)
+            sys.exit(1)
+        exe_path, exe_stat = result
+        
+        print("\n" + "=" * 60)
+        print("Executable ready!")
+        print(f"Location: {exe_path}")
+        print(f"Size: {exe_stat.st_size / (1024*1024):.1f} MB")
+        print("=" * 60)
+        
+        iscc_path = iscc_future.result()
+        errors = files_future.result()
     
     # Build installer
-    if not build_installer():
+    if not build_installer(exe_path, iscc_path, errors):
         sys.exit(1)
     
     print("\n" + "=" * 60)
@@ -9,10 +9,15 @@ __app_name__ = "KeyVisualizer"
 import sys
 import os
 import json
+import time
 from typing import Optional, List, Deque
-from collections import deque
+from collections import deque, OrderedDict
+from dataclasses import dataclass, fields
 from datetime import datetime
 
+if sys.platform == 'win32':
+    import winreg  # Autostart registry entry
+
 # Hide console window on Windows when running as a script
 if sys.platform == 'win32':
     import ctypes
@@ -23,16 +28,18 @@ if sys.platform == 'win32':
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QSystemTrayIcon, QMenu, QDialog, QVBoxLayout,
     QHBoxLayout, QLabel, QComboBox, QPushButton, QSpinBox, QGroupBox,
-    QMessageBox, QColorDialog, QFontComboBox, QCheckBox, QSlider,
+    QMessageBox, QColorDialog, QCheckBox, QSlider,
     QFrame, QGridLayout, QTabWidget, QLineEdit
 )
 from PyQt6.QtCore import (
-    Qt, QTimer, QSettings, QPoint, QPropertyAnimation, QEasingCurve,
-    QRect, QRectF, pyqtSignal, QObject
+    Qt, QTimer, QSettings, QPoint, QPointF, QPropertyAnimation, QEasingCurve,
+    QAbstractAnimation, QRect, QRectF, pyqtSignal, pyqtSlot, pyqtProperty, QObject,
+    QStringListModel
 )
 from PyQt6.QtGui import (
-    QIcon, QPixmap, QImage, QPainter, QFont, QColor, QAction, QScreen,
-    QFontDatabase, QPainterPath, QBrush, QPen, QRadialGradient
+    QIcon, QPixmap, QImage, QPainter, QFont, QFontMetrics, QColor, QAction,
+    QScreen, QFontDatabase, QPainterPath, QBrush, QPen, QRadialGradient, QRegion,
+    QPalette
 )
 
 from pynput import keyboard
@@ -89,16 +96,25 @@ KEY_DISPLAY_NAMES = {
 }
 
 
+# pynput Key members mapped to display names, so lookups need no str(key)
+_KEY_ENUM_NAMES = {
+    getattr(keyboard.Key, name[4:]): display
+    for name, display in KEY_DISPLAY_NAMES.items()
+    if hasattr(keyboard.Key, name[4:])  # Some keys only exist on some platforms
+}
+
+
 def get_key_name(key) -> Optional[str]:
     """Convert pynput key to display name."""
-    key_str = str(key)
-    
-    # Check special key mappings
-    if key_str in KEY_DISPLAY_NAMES:
-        return KEY_DISPLAY_NAMES[key_str]
+    # Handle special keys (Key.something)
+    if isinstance(key, keyboard.Key):
+        display = _KEY_ENUM_NAMES.get(key)
+        if display is not None:
+            return display
+        return key.name.replace('_', ' ').title()
     
     # Handle character keys
-    if hasattr(key, 'char') and key.char:
+    if isinstance(key, keyboard.KeyCode) and key.char:
         char = key.char
         # Show uppercase for letters
         if char.isalpha():
@@ -108,47 +124,23 @@ def get_key_name(key) -> Optional[str]:
             return char
         return None  # Will be handled by vk code
     
-    # Handle special keys (Key.something)
-    if key_str.startswith('Key.'):
-        return key_str[4:].replace('_', ' ').title()
-    
     # Don't return raw key representations like '<65>' or '\\x01'
     # Let get_key_from_vk handle these
     return None
 
 
-def get_key_from_vk(key) -> Optional[str]:
-    """Try to get a readable key name from virtual key code."""
-    vk = None
-    
-    # Try to get vk code from the key
-    if hasattr(key, 'vk') and key.vk is not None:
-        vk = key.vk
-    elif hasattr(key, '_scan'):
-        # Some pynput versions use _scan
-        vk = getattr(key, 'vk', None)
-    
-    if vk is None:
-        return None
-    
-    # Ensure vk is an integer
-    if not isinstance(vk, int):
-        try:
-            vk = int(vk)
-        except (ValueError, TypeError):
-            return None
-    
-    # A-Z keys (0x41-0x5A / 65-90)
-    if 0x41 <= vk <= 0x5A:
-        return chr(vk)
+def _build_vk_lookup() -> List[Optional[str]]:
+    """Display name for every Windows virtual key code, indexed by vk."""
+    table: List[Optional[str]] = [None] * 256
     
-    # 0-9 number row keys (0x30-0x39 / 48-57)
-    if 0x30 <= vk <= 0x39:
-        return chr(vk)
+    # A-Z (0x41-0x5A), 0-9 number row (0x30-0x39) and any other printable
+    # ASCII code show as their character; the ranges below take precedence
+    for vk in range(0x20, 0x7F):
+        table[vk] = chr(vk)
     
     # Numpad 0-9 (0x60-0x69 / 96-105)
-    if 0x60 <= vk <= 0x69:
-        return str(vk - 0x60)  # Convert to '0'-'9'
+    for vk in range(0x60, 0x6A):
+        table[vk] = str(vk - 0x60)
     
     # Numpad operators
     numpad_map = {
@@ -158,32 +150,89 @@ def get_key_from_vk(key) -> Optional[str]:
         0x6E: '.',   # Numpad .
         0x6F: '/',   # Numpad /
     }
-    if vk in numpad_map:
-        return numpad_map[vk]
-    
     # Common punctuation/symbols
     vk_map = {
         0xBB: '=', 0xBC: ',', 0xBD: '-', 0xBE: '.', 0xBF: '/',
         0xBA: ';', 0xDB: '[', 0xDC: '\\', 0xDD: ']', 0xDE: "'",
         0xC0: '`',
     }
-    if vk in vk_map:
-        return vk_map[vk]
+    for vk, name in {**numpad_map, **vk_map}.items():
+        table[vk] = name
     
     # F1-F12 keys (0x70-0x7B / 112-123)
-    if 0x70 <= vk <= 0x7B:
-        return f'F{vk - 0x6F}'
+    for vk in range(0x70, 0x7C):
+        table[vk] = f'F{vk - 0x6F}'
     
-    # For unmapped keys in printable ASCII range, try to show the character
-    if 0x20 <= vk <= 0x7E:
-        return chr(vk)
+    return table
+
+
+_VK_LOOKUP = _build_vk_lookup()
+
+
+def get_key_from_vk(key) -> Optional[str]:
+    """Try to get a readable key name from virtual key code."""
+    try:
+        vk = key.vk  # pynput always reports vk as an int (or None)
+    except AttributeError:
+        return None
     
-    return None
+    if vk is None:
+        return None
+    
+    return _VK_LOOKUP[vk] if 0 <= vk < 256 else None
 
 
 # Modifier key identifiers
 MODIFIER_KEYS = {'Ctrl', 'Alt', 'Shift', 'Win', 'AltGr'}
 
+# Bits for modifiers that take part in combos (AltGr only selects characters)
+_MOD_BITS = {'Ctrl': 1, 'Alt': 2, 'Shift': 4, 'Win': 8}
+
+# Combo label prefix for every modifier mask, in standard order: Ctrl+Alt+Shift+Win+
+_MOD_PREFIXES = [
+    ''.join(mod + '+' for mod, bit in _MOD_BITS.items() if mask & bit)
+    for mask in range(1 << len(_MOD_BITS))
+]
+
+
+class InputEventQueue(QObject):
+    """Bounded queue shared by the pynput hook threads, drained on the GUI thread.
+    
+    Hooks only append raw events: name lookup and combo logic run on the GUI
+    thread, since a slow hook callback lags input system-wide. Only the first
+    event after a drain wakes the GUI thread, so a burst costs one queued
+    signal instead of one per event.
+    """
+    _wakeup = pyqtSignal()
+    
+    def __init__(self, maxlen: int = 512):
+        super().__init__()
+        self._events: Deque[tuple] = deque(maxlen=maxlen)
+        self._wakeup_pending = False
+        self._handlers: dict = {}
+        self._wakeup.connect(self._drain, Qt.ConnectionType.QueuedConnection)
+    
+    def register(self, kind: str, handler):
+        """Route events of the given kind to handler(*args) on the GUI thread."""
+        self._handlers[kind] = handler
+    
+    def put(self, kind: str, *args):
+        """Called from a pynput thread."""
+        self._events.append((kind, args))
+        if not self._wakeup_pending:
+            self._wakeup_pending = True
+            self._wakeup.emit()
+    
+    @pyqtSlot()
+    def _drain(self):
+        # Clear the flag first so events added mid-drain schedule another wakeup
+        self._wakeup_pending = False
+        events = self._events
+        handlers = self._handlers
+        while events:
+            kind, args = events.popleft()
+            handlers[kind](*args)
+
 
 class KeyboardListener(QObject):
     """Global keyboard listener using pynput with modifier combination support."""
@@ -191,10 +240,12 @@ class KeyboardListener(QObject):
     key_released = pyqtSignal(str)
     combo_pressed = pyqtSignal(str)  # For key combinations like Ctrl+S
     
-    def __init__(self):
+    def __init__(self, queue: Optional[InputEventQueue] = None):
         super().__init__()
         self.listener = None
-        self.active_modifiers = set()  # Currently held modifier keys
+        self._mod_mask = 0  # Currently held modifier keys, as _MOD_BITS
+        self._queue = queue if queue is not None else InputEventQueue()
+        self._queue.register('k', self._handle_event)
     
     def start(self):
         self.listener = keyboard.Listener(
@@ -209,6 +260,21 @@ class KeyboardListener(QObject):
             self.listener = None
     
     def _on_press(self, key):
+        """Called from pynput thread on key press."""
+        self._queue.put('k', key, True)
+    
+    def _on_release(self, key):
+        """Called from pynput thread on key release."""
+        self._queue.put('k', key, False)
+    
+    def _handle_event(self, key, pressed: bool):
+        """Process a queued key event on the GUI thread."""
+        if pressed:
+            self._handle_press(key)
+        else:
+            self._handle_release(key)
+    
+    def _handle_press(self, key):
         key_name = get_key_name(key)
         
         # If key_name is None, try to get from vk code
@@ -220,23 +286,15 @@ class KeyboardListener(QObject):
         
         # Check if this is a modifier key
         if key_name in MODIFIER_KEYS:
-            self.active_modifiers.add(key_name)
+            self._mod_mask |= _MOD_BITS.get(key_name, 0)
             self.key_pressed.emit(key_name)
+        elif self._mod_mask:
+            # Non-modifier key with modifiers held - show as a combo
+            self.combo_pressed.emit(_MOD_PREFIXES[self._mod_mask] + key_name)
         else:
-            # Non-modifier key - check if we should combine with modifiers
-            if self.active_modifiers:
-                # Build combo string in standard order: Ctrl+Alt+Shift+Win+Key
-                combo_parts = []
-                for mod in ['Ctrl', 'Alt', 'Shift', 'Win']:
-                    if mod in self.active_modifiers:
-                        combo_parts.append(mod)
-                combo_parts.append(key_name)
-                combo_str = '+'.join(combo_parts)
-                self.combo_pressed.emit(combo_str)
-            else:
-                self.key_pressed.emit(key_name)
+            self.key_pressed.emit(key_name)
     
-    def _on_release(self, key):
+    def _handle_release(self, key):
         key_name = get_key_name(key)
         
         # If key_name is None, try to get from vk code
@@ -248,7 +306,7 @@ class KeyboardListener(QObject):
         
         # Remove from active modifiers if it's a modifier
         if key_name in MODIFIER_KEYS:
-            self.active_modifiers.discard(key_name)
+            self._mod_mask &= ~_MOD_BITS.get(key_name, 0)
         
         self.key_released.emit(key_name)
 
@@ -268,9 +326,11 @@ class MouseClickListener(QObject):
     click_pressed = pyqtSignal(str, float, float)
     click_released = pyqtSignal(str)
     
-    def __init__(self):
+    def __init__(self, queue: Optional[InputEventQueue] = None):
         super().__init__()
         self._listener = None
+        self._queue = queue if queue is not None else InputEventQueue()
+        self._queue.register('m', self._handle_click)
     
     def start(self):
         """Start listening for mouse clicks."""
@@ -287,6 +347,10 @@ class MouseClickListener(QObject):
     
     def _on_click(self, x, y, button, pressed):
         """Called from pynput thread on click/release."""
+        self._queue.put('m', x, y, button, pressed)
+    
+    def _handle_click(self, x, y, button, pressed: bool):
+        """Process a queued click on the GUI thread."""
         name = MOUSE_BUTTON_NAMES.get(button)
         if name is None:
             return
@@ -296,14 +360,77 @@ class MouseClickListener(QObject):
             self.click_released.emit(name)
 
 
+@dataclass(frozen=True)
+class OverlayConfig:
+    """Immutable snapshot of the settings the overlays read while painting.
+    
+    Built once per settings change so paint and fade paths use plain
+    attribute access instead of string-keyed dict lookups.
+    """
+    bg_color: str
+    text_color: str
+    border_color: str
+    show_border: bool
+    font_family: str
+    font_size: int
+    font_bold: bool
+    padding: int
+    min_bubble_width: int
+    border_radius: int
+    border_width: int
+    overlay_height: int
+    margin_bottom: int
+    margin_horizontal: int
+    bubble_spacing: int
+    fade_speed: float
+    max_keys: int
+    position_horizontal: str
+    position_vertical: str
+    screen_selection: str
+    click_spot_radius: int
+    click_spot_fade_ms: int
+    click_spot_color_left: str
+    click_spot_color_right: str
+    click_spot_color_middle: str
+    click_spot_opacity: float
+    
+    @classmethod
+    def from_dict(cls, config: dict) -> "OverlayConfig":
+        """Pick the overlay fields out of a full app config dict."""
+        return cls(**{name: config[name] for name in _OVERLAY_CONFIG_FIELDS})
+
+
+_OVERLAY_CONFIG_FIELDS = tuple(f.name for f in fields(OverlayConfig))
+
+
+class BubbleStyle:
+    """Fonts, brushes and pens shared by all key bubbles, built once per config."""
+    
+    def __init__(self, cfg: OverlayConfig):
+        self.font = QFont(cfg.font_family, cfg.font_size)
+        self.font.setBold(cfg.font_bold)
+        self.font_metrics = QFontMetrics(self.font)
+        
+        self.border_width = float(cfg.border_width) if cfg.show_border else 0.0
+        if self.border_width > 0:
+            self.border_pen = QPen(QColor(cfg.border_color), self.border_width)
+            self.border_pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
+        else:
+            self.border_pen = QPen(Qt.PenStyle.NoPen)
+        
+        self.bg_brush = QBrush(QColor(cfg.bg_color))
+        self.text_pen = QPen(QColor(cfg.text_color))
+
+
 class KeyBubble(QWidget):
     """Individual key bubble widget with fade animation."""
     
-    def __init__(self, key_text: str, config: dict, parent=None):
+    def __init__(self, key_text: str, cfg: OverlayConfig, bubble_style: BubbleStyle, parent=None):
         super().__init__(parent)
         self.key_text = key_text
-        self.config = config
-        self.opacity = 1.0
+        self.cfg = cfg
+        self.bubble_style = bubble_style
+        self._alpha = 255  # Opacity quantised to Qt's 8-bit alpha
         
         # Calculate size based on text
         self.calculate_size()
@@ -313,20 +440,15 @@ class KeyBubble(QWidget):
     
     def calculate_size(self):
         """Calculate bubble size based on text and config."""
-        # Get font metrics
-        font = QFont(self.config['font_family'], self.config['font_size'])
-        font.setBold(self.config['font_bold'])
-        
-        from PyQt6.QtGui import QFontMetrics
-        fm = QFontMetrics(font)
+        fm = self.bubble_style.font_metrics
         text_width = fm.horizontalAdvance(self.key_text)
         text_height = fm.height()
         
         # Get config values
-        font_size = self.config.get('font_size', 24)
-        padding = self.config.get('padding', 15)
-        min_width = self.config.get('min_bubble_width', 55)
-        border_width = self.config['border_width'] if self.config.get('show_border', True) else 0
+        font_size = self.cfg.font_size
+        padding = self.cfg.padding
+        min_width = self.cfg.min_bubble_width
+        border_width = self.cfg.border_width if self.cfg.show_border else 0
         
         # Add padding around text
         content_width = text_width + (padding * 2)
@@ -356,96 +478,99 @@ class KeyBubble(QWidget):
                 height = int(width * 1.3)
         
         self.setFixedSize(int(width), int(height))
+        self._path = self._build_path()
+        self._render_cache()
     
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
-        painter.setOpacity(self.opacity)
-        
-        # Get config values
-        bg_color = QColor(self.config['bg_color'])
-        border_color = QColor(self.config['border_color'])
-        text_color = QColor(self.config['text_color'])
-        border_width = float(self.config['border_width']) if self.config['show_border'] else 0.0
-        radius = float(self.config['border_radius'])
+    def _build_path(self) -> QPainterPath:
+        """Rounded-rect outline for the current size, cached until resized."""
+        radius = float(self.cfg.border_radius)
         
-        # Calculate inset for border (border is drawn centered on the edge)
-        inset = (border_width / 2.0) + 1.0
-        
-        # Create float rect for smooth rendering
-        w = float(self.width())
-        h = float(self.height())
-        
-        x = inset
-        y = inset
-        rect_w = w - (inset * 2)
-        rect_h = h - (inset * 2)
+        # Inset for border (border is drawn centered on the edge)
+        inset = (self.bubble_style.border_width / 2.0) + 1.0
+        rect = QRectF(self.rect()).adjusted(inset, inset, -inset, -inset)
         
         # Ensure radius is reasonable (not larger than half of smallest dimension)
-        max_radius = min(rect_w, rect_h) / 2.0
-        r = min(radius, max_radius)
+        r = min(radius, min(rect.width(), rect.height()) / 2.0)
         
-        # Build path for rounded rectangle manually for maximum control
         path = QPainterPath()
+        path.addRoundedRect(rect, r, r)
+        return path
+    
+    def get_opacity(self) -> float:
+        return self._alpha / 255.0
+    
+    def set_opacity(self, value: float):
+        alpha = min(255, max(0, round(value * 255)))
+        if alpha == self._alpha:
+            return  # Animation steps finer than one alpha level don't repaint
+        self._alpha = alpha
+        self.update()
+    
+    # Animatable so fades run as a QPropertyAnimation
+    opacity = pyqtProperty(float, fget=get_opacity, fset=set_opacity)
+    
+    def _render_cache(self):
+        """Rasterize the bubble once; fading only changes the blit opacity."""
+        ratio = self.devicePixelRatioF()
+        self._cache = QPixmap(self.size() * ratio)
+        self._cache.setDevicePixelRatio(ratio)
+        self._cache.fill(Qt.GlobalColor.transparent)
         
-        # Start at top-left, after the curve
-        path.moveTo(x + r, y)
-        
-        # Top edge to top-right corner
-        path.lineTo(x + rect_w - r, y)
-        # Top-right corner arc
-        path.arcTo(x + rect_w - 2*r, y, 2*r, 2*r, 90, -90)
-        
-        # Right edge to bottom-right corner
-        path.lineTo(x + rect_w, y + rect_h - r)
-        # Bottom-right corner arc
-        path.arcTo(x + rect_w - 2*r, y + rect_h - 2*r, 2*r, 2*r, 0, -90)
-        
-        # Bottom edge to bottom-left corner
-        path.lineTo(x + r, y + rect_h)
-        # Bottom-left corner arc
-        path.arcTo(x, y + rect_h - 2*r, 2*r, 2*r, -90, -90)
-        
-        # Left edge to top-left corner
-        path.lineTo(x, y + r)
-        # Top-left corner arc
-        path.arcTo(x, y, 2*r, 2*r, 180, -90)
-        
-        path.closeSubpath()
-        
-        # Set up pen for border
-        if self.config['show_border'] and border_width > 0:
-            pen = QPen(border_color, border_width)
-            pen.setJoinStyle(Qt.PenJoinStyle.RoundJoin)
-            painter.setPen(pen)
-        else:
-            painter.setPen(Qt.PenStyle.NoPen)
-        
-        # Set brush for fill
-        painter.setBrush(QBrush(bg_color))
+        painter = QPainter(self._cache)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing, True)
         
-        # Draw the path
-        painter.drawPath(path)
+        # Border and fill
+        style = self.bubble_style
+        painter.setPen(style.border_pen)
+        painter.setBrush(style.bg_brush)
+        painter.drawPath(self._path)
         
         # Draw text centered
-        font = QFont(self.config['font_family'], self.config['font_size'])
-        font.setBold(self.config['font_bold'])
-        painter.setFont(font)
-        painter.setPen(text_color)
+        painter.setFont(style.font)
+        painter.setPen(style.text_pen)
         painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, self.key_text)
+        painter.end()
+    
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setOpacity(self._alpha / 255.0)
+        painter.drawPixmap(0, 0, self._cache)
 
 
 class KeyOverlay(QWidget):
     """Main overlay window that displays key presses."""
     
+    # Rebase row offsets past this so the bubble container stays well inside
+    # Qt's widget coordinate limits during long typing sessions
+    MAX_ROW_OFFSET = 1 << 20
+    
+    # Config keys that affect the overlay's size/position, and those baked
+    # into the bubbles' style and cached pixmaps
+    GEOMETRY_KEYS = frozenset({
+        'font_size', 'padding', 'border_width', 'show_border', 'overlay_height',
+        'position_horizontal', 'position_vertical', 'margin_bottom',
+        'margin_horizontal', 'screen_selection',
+    })
+    BUBBLE_KEYS = frozenset({
+        'bg_color', 'text_color', 'border_color', 'show_border', 'font_family',
+        'font_size', 'font_bold', 'padding', 'min_bubble_width', 'border_radius',
+        'border_width', 'bubble_spacing',
+    })
+    
     def __init__(self, config: dict):
         super().__init__()
         self.config = config
-        self.key_bubbles: List[KeyBubble] = []
-        self.fade_timers: dict = {}
-        self.active_keys: dict = {}  # Track currently held keys
+        self.cfg = OverlayConfig.from_dict(config)
+        self.fade_animations: dict = {}  # Running fade-out animations by key
+        # Visible bubbles by key, in left-to-right display order
+        self.active_keys: "OrderedDict[str, KeyBubble]" = OrderedDict()
+        # Row-relative x of each bubble; offsets only grow, so dropping the
+        # leftmost bubble never shifts the others
+        self._offsets: dict = {}
+        self._row_end = 0  # Offset where the next bubble would go
         self.combo_key_map: dict = {}  # Maps individual keys to their combo (e.g., "S" -> "Ctrl+S")
+        self.bubble_style = BubbleStyle(self.cfg)
         
         self.setup_ui()
         self.update_position()
@@ -462,15 +587,20 @@ class KeyOverlay(QWidget):
         self.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
         self.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating)
         
+        # Bubbles sit at their row offsets inside this container; centering
+        # the row moves the container once instead of every bubble
+        self._bubble_container = QWidget(self)
+        self._bubble_container.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        
         # Set size - height will auto-adjust based on font
         self.setMinimumWidth(400)
         self.update_height()
     
     def calculate_required_height(self) -> int:
         """Calculate the minimum overlay height needed for current font size."""
-        font_size = self.config.get('font_size', 24)
-        padding = self.config.get('padding', 15)
-        border_width = self.config.get('border_width', 3) if self.config.get('show_border', True) else 0
+        font_size = self.cfg.font_size
+        padding = self.cfg.padding
+        border_width = self.cfg.border_width if self.cfg.show_border else 0
         
         # Calculate bubble height: font height + padding + border + margins
         # Font height is approximately 1.4x font size
@@ -490,14 +620,14 @@ class KeyOverlay(QWidget):
         """Update overlay height based on font size."""
         required_height = self.calculate_required_height()
         # Use the larger of calculated height or configured minimum
-        min_height = self.config.get('overlay_height', 80)
+        min_height = self.cfg.overlay_height
         actual_height = max(required_height, min_height)
         self.setFixedHeight(actual_height)
     
     def update_position(self):
         """Position overlay based on configuration."""
         # Get the selected screen
-        screen_selection = self.config.get('screen_selection', 'primary')
+        screen_selection = self.cfg.screen_selection
         screens = QApplication.screens()
         
         if not screens:
@@ -529,8 +659,8 @@ class KeyOverlay(QWidget):
         self.setFixedWidth(overlay_width)
         
         # Calculate horizontal position
-        h_pos = self.config.get('position_horizontal', 'center')
-        h_margin = self.config.get('margin_horizontal', 0)
+        h_pos = self.cfg.position_horizontal
+        h_margin = self.cfg.margin_horizontal
         
         if h_pos == 'left':
             x = geometry.x() + h_margin + 20
@@ -540,8 +670,8 @@ class KeyOverlay(QWidget):
             x = geometry.x() + (geometry.width() - self.width()) // 2 + h_margin
         
         # Calculate vertical position
-        v_pos = self.config.get('position_vertical', 'bottom')
-        v_margin = self.config['margin_bottom']
+        v_pos = self.cfg.position_vertical
+        v_margin = self.cfg.margin_bottom
         
         if v_pos == 'top':
             y = geometry.y() + v_margin
@@ -554,39 +684,31 @@ class KeyOverlay(QWidget):
         """Add a key bubble to the display."""
         # If key already shown and held, reset its timer
         if key_name in self.active_keys:
-            bubble = self.active_keys[key_name]
-            bubble.opacity = 1.0
-            bubble.update()
-            if key_name in self.fade_timers:
-                self.fade_timers[key_name].stop()
-                del self.fade_timers[key_name]
+            self._stop_fade(key_name)
+            self.active_keys[key_name].opacity = 1.0
             return
         
         # Create new bubble
-        bubble = KeyBubble(key_name, self.config, self)
-        self.key_bubbles.append(bubble)
+        bubble = KeyBubble(key_name, self.cfg, self.bubble_style, self._bubble_container)
+        bubble.move(self._row_end, (self.height() - bubble.height()) // 2)
         self.active_keys[key_name] = bubble
+        self._offsets[key_name] = self._row_end
+        self._row_end += bubble.width() + self.cfg.bubble_spacing
+        
+        # Limit number of visible keys (oldest first)
+        max_keys = self.cfg.max_keys
+        while len(self.active_keys) > max_keys:
+            old_key = next(iter(self.active_keys))
+            self._stop_fade(old_key)
+            self._remove_bubble(old_key).deleteLater()
+        
+        if self._offsets[next(iter(self.active_keys))] > self.MAX_ROW_OFFSET:
+            self._rebase_offsets()
         
         # Position bubbles
         self.layout_bubbles()
         
         bubble.show()
-        
-        # Limit number of visible keys
-        max_keys = self.config['max_keys']
-        while len(self.key_bubbles) > max_keys:
-            old_bubble = self.key_bubbles.pop(0)
-            key_to_remove = None
-            for k, v in self.active_keys.items():
-                if v == old_bubble:
-                    key_to_remove = k
-                    break
-            if key_to_remove:
-                del self.active_keys[key_to_remove]
-                if key_to_remove in self.fade_timers:
-                    self.fade_timers[key_to_remove].stop()
-                    del self.fade_timers[key_to_remove]
-            old_bubble.deleteLater()
     
     def release_key(self, key_name: str):
         """Start fade out for released key."""
@@ -604,16 +726,27 @@ class KeyOverlay(QWidget):
         self._start_fade(key_name)
     
     def _start_fade(self, key_name: str):
-        """Start fade timer for a key."""
-        if key_name not in self.active_keys:
+        """Start the fade-out animation for a key."""
+        if key_name not in self.active_keys or key_name in self.fade_animations:
             return
         
-        # Start fade timer
-        if key_name not in self.fade_timers:
-            timer = QTimer()
-            timer.timeout.connect(lambda: self.fade_key(key_name))
-            timer.start(50)  # Update every 50ms
-            self.fade_timers[key_name] = timer
+        bubble = self.active_keys[key_name]
+        # fade_speed is the opacity lost per second
+        duration_ms = int(1000 / self.cfg.fade_speed)
+        
+        anim = QPropertyAnimation(bubble, b"opacity", bubble)
+        anim.setDuration(duration_ms)
+        anim.setStartValue(bubble.opacity)
+        anim.setEndValue(0.0)
+        anim.finished.connect(lambda: self._finish_fade(key_name, bubble))
+        anim.start(QAbstractAnimation.DeletionPolicy.DeleteWhenStopped)
+        self.fade_animations[key_name] = anim
+    
+    def _stop_fade(self, key_name: str):
+        """Cancel a running fade-out, if any."""
+        anim = self.fade_animations.pop(key_name, None)
+        if anim is not None:
+            anim.stop()
     
     def show_combo(self, combo: str):
         """Show a key combination, removing individual modifier bubbles."""
@@ -623,14 +756,8 @@ class KeyOverlay(QWidget):
         # Remove modifier bubbles that are part of this combo
         for part in parts[:-1]:  # All except the last (the actual key)
             if part in self.active_keys:
-                bubble = self.active_keys[part]
-                if part in self.fade_timers:
-                    self.fade_timers[part].stop()
-                    del self.fade_timers[part]
-                if bubble in self.key_bubbles:
-                    self.key_bubbles.remove(bubble)
-                del self.active_keys[part]
-                bubble.deleteLater()
+                self._stop_fade(part)
+                self._remove_bubble(part).deleteLater()
         
         # Map all parts of the combo to the combo name for release tracking
         for part in parts:
@@ -639,76 +766,121 @@ class KeyOverlay(QWidget):
         # Add the combo as a single bubble
         self.add_key(combo)
     
-    def fade_key(self, key_name: str):
-        """Gradually fade out a key bubble."""
-        if key_name not in self.active_keys:
-            if key_name in self.fade_timers:
-                self.fade_timers[key_name].stop()
-                del self.fade_timers[key_name]
-            return
+    def _finish_fade(self, key_name: str, bubble: KeyBubble):
+        """Remove a bubble once its fade-out animation has completed."""
+        self.fade_animations.pop(key_name, None)
+        if self.active_keys.get(key_name) is not bubble:
+            return  # Already removed or replaced
         
-        bubble = self.active_keys[key_name]
-        fade_speed = self.config['fade_speed'] / 1000.0 * 50  # Convert to per-tick
-        bubble.opacity -= fade_speed
-        bubble.update()
-        
-        if bubble.opacity <= 0:
-            # Remove bubble
-            self.fade_timers[key_name].stop()
-            del self.fade_timers[key_name]
-            del self.active_keys[key_name]
-            if bubble in self.key_bubbles:
-                self.key_bubbles.remove(bubble)
-            bubble.deleteLater()
-            self.layout_bubbles()
+        self._remove_bubble(key_name).deleteLater()
+        self.layout_bubbles()
+    
+    def _remove_bubble(self, key_name: str) -> KeyBubble:
+        """Drop a bubble from the row, closing the gap only if it was in the middle."""
+        was_first = next(iter(self.active_keys)) == key_name
+        bubble = self.active_keys.pop(key_name)
+        offset = self._offsets.pop(key_name)
+        shift = bubble.width() + self.cfg.bubble_spacing
+        
+        if not self.active_keys:
+            self._offsets.clear()
+            self._row_end = 0
+        elif offset + shift == self._row_end:
+            self._row_end = offset  # Was the rightmost bubble
+        elif not was_first:
+            for k, o in self._offsets.items():
+                if o > offset:
+                    self._offsets[k] = o - shift
+                    self.active_keys[k].move(o - shift, self.active_keys[k].y())
+            self._row_end -= shift
+        return bubble
+    
+    def _rebase_offsets(self):
+        """Shift all offsets so the leftmost bubble is back at zero."""
+        base = self._offsets[next(iter(self.active_keys))]
+        for k, bubble in self.active_keys.items():
+            self._offsets[k] -= base
+            bubble.move(self._offsets[k], bubble.y())
+        self._row_end -= base
     
     def layout_bubbles(self):
         """Arrange bubbles horizontally centered."""
-        if not self.key_bubbles:
+        if not self.active_keys:
             return
         
-        spacing = self.config['bubble_spacing']
-        total_width = sum(b.width() for b in self.key_bubbles) + spacing * (len(self.key_bubbles) - 1)
-        
-        start_x = (self.width() - total_width) // 2
-        y = (self.height() - self.key_bubbles[0].height()) // 2 if self.key_bubbles else 0
+        first_offset = self._offsets[next(iter(self.active_keys))]
+        total_width = self._row_end - self.cfg.bubble_spacing - first_offset
+        start_x = (self.width() - total_width) // 2 - first_offset
         
-        x = start_x
-        for bubble in self.key_bubbles:
-            bubble.move(int(x), int(y))
-            x += bubble.width() + spacing
+        # One geometry change for the whole row
+        self._bubble_container.setGeometry(int(start_x), 0, self._row_end, self.height())
     
-    def update_config(self, config: dict):
-        """Update configuration and refresh display."""
+    def update_config(self, config: dict, changed: Optional[set] = None):
+        """Update configuration and refresh display.
+        
+        ``changed`` names the keys that differ from the current config; only
+        the work those keys need is redone. None means everything changed.
+        """
         self.config = config
-        self.update_height()  # Auto-adjust height based on font size
-        self.update_position()
+        self.cfg = OverlayConfig.from_dict(config)
+        if changed is None or not changed.isdisjoint(self.GEOMETRY_KEYS):
+            self.update_height()  # Auto-adjust height based on font size
+            self.update_position()
+        if changed is not None and changed.isdisjoint(self.BUBBLE_KEYS):
+            # Existing bubbles still look right; re-centre them if the
+            # overlay height changed
+            height = self.height()
+            for bubble in self.active_keys.values():
+                bubble.move(bubble.x(), (height - bubble.height()) // 2)
+            return
+        
+        self.bubble_style = BubbleStyle(self.cfg)
         
         # Clear existing bubbles
-        for bubble in self.key_bubbles:
+        for anim in self.fade_animations.values():
+            anim.stop()
+        self.fade_animations.clear()
+        for bubble in self.active_keys.values():
             bubble.deleteLater()
-        self.key_bubbles.clear()
         self.active_keys.clear()
+        self._offsets.clear()
+        self._row_end = 0
         self.combo_key_map.clear()
-        for timer in self.fade_timers.values():
-            timer.stop()
-        self.fade_timers.clear()
     
     def resizeEvent(self, event):
         super().resizeEvent(event)
         self.layout_bubbles()
 
 
-def _default_click_spot_config() -> dict:
-    """Default config values for click spot (used when key missing)."""
-    return {
-        'click_spot_radius': 45,
-        'click_spot_fade_ms': 400,
-        'click_spot_color_left': '#6490ff',
-        'click_spot_color_right': '#ff7864',
-        'click_spot_color_middle': '#8cc88c',
-        'click_spot_opacity': 0.7,
-    }
+class Throttler(QObject):
+    """Leading+trailing edge throttle: call func at most once per interval.
+    
+    The first call runs immediately; calls made while the interval is running
+    collapse into a single trailing call when it ends.
+    """
+    
+    def __init__(self, func, interval_ms: int = 16, parent=None):
+        super().__init__(parent)
+        self._func = func
+        self._pending = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._on_timeout)
+    
+    def __call__(self):
+        if self._timer.isActive():
+            self._pending = True
+            return
+        self._func()
+        self._timer.start()
+    
+    @pyqtSlot()
+    def _on_timeout(self):
+        if self._pending:
+            self._pending = False
+            self._func()
+            self._timer.start()
 
 
 class ClickSpotOverlay(QWidget):
@@ -718,15 +890,33 @@ class ClickSpotOverlay(QWidget):
     
     def __init__(self, config: dict, parent=None):
         super().__init__(parent)
-        self.config = config
-        self.spots: List[dict] = []
+        self.update_config(config)
+        # (x, y, created_at, button_name), oldest first. Every spot shares the
+        # same fade duration, so they always expire from the left.
+        self.spots: Deque[tuple] = deque()
         self._fade_timer = QTimer(self)
         self._fade_timer.timeout.connect(self._tick_fade)
+        self._dirty = QRegion()  # Spot areas waiting for the next repaint
+        self._request_update = Throttler(self._flush_update, 16, self)  # ~one repaint per frame
         self.setup_ui()
     
-    def update_config(self, config: dict):
-        """Update config (e.g. after settings change)."""
+    # Config keys rasterized into the spot sprites
+    SPRITE_KEYS = frozenset({
+        'click_spot_radius', 'click_spot_color_left', 'click_spot_color_right',
+        'click_spot_color_middle',
+    })
+    
+    def update_config(self, config: dict, changed: Optional[set] = None):
+        """Update config (e.g. after settings change).
+        
+        Sprites are only re-rendered when a key in ``changed`` affects them;
+        None means everything changed.
+        """
         self.config = config
+        # Typed snapshot, read on every tick/paint
+        self.cfg = OverlayConfig.from_dict(config)
+        if changed is None or not changed.isdisjoint(self.SPRITE_KEYS):
+            self._spot_sprites = self._build_sprites()
     
     def setup_ui(self):
         self.setWindowFlags(
@@ -756,98 +946,237 @@ class ClickSpotOverlay(QWidget):
     
     def add_spot(self, screen_x: float, screen_y: float, button_name: str):
         """Add a gradient circle at the given screen position."""
-        import time
-        self.spots.append({
-            "x": screen_x,
-            "y": screen_y,
-            "alpha": 1.0,
-            "button_name": button_name,
-            "created_at": time.perf_counter(),
-        })
+        self.spots.append((screen_x, screen_y, time.perf_counter(), button_name))
         if not self._fade_timer.isActive():
             self._fade_timer.start(self.FADE_TICK_MS)
-        self.update()
+        self._dirty += self._spot_rect(screen_x, screen_y)
+        self._request_update()
     
+    @pyqtSlot()
     def _tick_fade(self):
-        """Decay alpha for all spots and remove dead ones."""
-        import time
-        cfg = _default_click_spot_config()
-        cfg.update(self.config)
-        fade_ms = cfg.get('click_spot_fade_ms', 400)
-        now = time.perf_counter()
-        for s in self.spots:
-            elapsed_ms = (now - s["created_at"]) * 1000
-            s["alpha"] = max(0.0, 1.0 - elapsed_ms / fade_ms)
-        self.spots = [s for s in self.spots if s["alpha"] > 0.001]
-        if not self.spots:
+        """Drop fully faded spots; alpha itself is derived at paint time."""
+        expire_before = time.perf_counter() - self.cfg.click_spot_fade_ms / 1000.0
+        spots = self.spots
+        dirty = self._dirty
+        # Expired spots still need one repaint to erase their last frame
+        while spots and spots[0][2] <= expire_before:
+            x, y, _, _ = spots.popleft()
+            dirty += self._spot_rect(x, y)
+        for x, y, _, _ in spots:
+            dirty += self._spot_rect(x, y)
+        self._dirty = dirty
+        if not spots:
             self._fade_timer.stop()
-        self.update()
-    
-    def _spot_colors(self) -> dict:
-        """Resolve spot colors from config."""
-        cfg = _default_click_spot_config()
-        cfg.update(self.config)
-        return {
-            "Left Click": QColor(cfg.get('click_spot_color_left', '#6490ff')),
-            "Right Click": QColor(cfg.get('click_spot_color_right', '#ff7864')),
-            "Middle Click": QColor(cfg.get('click_spot_color_middle', '#8cc88c')),
-        }
-    
-    def paintEvent(self, event):
-        cfg = _default_click_spot_config()
-        cfg.update(self.config)
-        r = int(cfg.get('click_spot_radius', 45))
-        opacity = float(cfg.get('click_spot_opacity', 0.7))
-        spot_colors = self._spot_colors()
-        
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, True)
-        
-        win_x = self.geometry().x()
-        win_y = self.geometry().y()
-        
-        for s in self.spots:
-            local_x = s["x"] - win_x
-            local_y = s["y"] - win_y
-            alpha = s["alpha"]
-            button_name = s.get("button_name", "Left Click")
-            
-            center_color = spot_colors.get(button_name, spot_colors["Left Click"])
-            center_color = QColor(center_color)
-            center_color.setAlphaF(alpha * opacity)
+        self._request_update()
+    
+    def _spot_rect(self, screen_x: float, screen_y: float) -> QRect:
+        """Widget-local area covered by a spot at the given screen position."""
+        r = int(self.cfg.click_spot_radius)
+        geometry = self.geometry()
+        return QRect(int(screen_x - geometry.x() - r), int(screen_y - geometry.y() - r),
+                     2 * r + 1, 2 * r + 1)
+    
+    def _flush_update(self):
+        """Repaint only the accumulated spot areas instead of the whole desktop."""
+        if not self._dirty.isEmpty():
+            self.update(self._dirty)
+            self._dirty = QRegion()
+    
+    def _build_sprites(self) -> dict:
+        """Rasterize one full-alpha gradient circle per button color."""
+        cfg = self.cfg
+        r = int(cfg.click_spot_radius)
+        ratio = self.devicePixelRatioF()
+        sprites = {}
+        for button_name, color in (
+            ("Left Click", cfg.click_spot_color_left),
+            ("Right Click", cfg.click_spot_color_right),
+            ("Middle Click", cfg.click_spot_color_middle),
+        ):
+            center_color = QColor(color)
             edge_color = QColor(center_color)
             edge_color.setAlphaF(0.0)
             
-            gradient = QRadialGradient(local_x, local_y, r, local_x, local_y)
+            gradient = QRadialGradient(r, r, r, r, r)
             gradient.setColorAt(0.0, center_color)
             gradient.setColorAt(0.5, edge_color)
             gradient.setColorAt(1.0, edge_color)
             
+            sprite = QPixmap(int(r * 2 * ratio), int(r * 2 * ratio))
+            sprite.setDevicePixelRatio(ratio)
+            sprite.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(sprite)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
             painter.setPen(Qt.PenStyle.NoPen)
             painter.setBrush(QBrush(gradient))
-            painter.drawEllipse(int(local_x - r), int(local_y - r), int(r * 2), int(r * 2))
+            painter.drawEllipse(0, 0, r * 2, r * 2)
+            painter.end()
+            sprites[button_name] = sprite
+        
+        # Fragment blits work in device pixels: sample the whole sprite and
+        # scale it back down to logical size
+        self._sprite_source = QRectF(0, 0, sprite.width(), sprite.height())
+        self._sprite_scale = 1.0 / ratio
+        return sprites
+    
+    def paintEvent(self, event):
+        cfg = self.cfg
+        r = int(cfg.click_spot_radius)
+        opacity = float(cfg.click_spot_opacity)
+        sprites = self._spot_sprites
+        
+        painter = QPainter(self)
+        painter.setClipRegion(event.region())
+        
+        win_x = self.geometry().x()
+        win_y = self.geometry().y()
+        now = time.perf_counter()
+        fade_s = cfg.click_spot_fade_ms / 1000.0
+        
+        source = self._sprite_source
+        scale = self._sprite_scale
+        
+        # Collect one fragment per spot, grouped by sprite, so each color is a
+        # single batched blit instead of one draw call (and opacity change) per spot
+        batches: dict = {}
+        for x, y, created_at, button_name in self.spots:
+            alpha = 1.0 - (now - created_at) / fade_s
+            if alpha <= 0.001:
+                continue
+            if button_name not in sprites:
+                button_name = "Left Click"
+            # Fragment position is the sprite center; keep the top-left on whole pixels
+            center = QPointF(int(x - win_x - r) + r, int(y - win_y - r) + r)
+            batches.setdefault(button_name, []).append(
+                QPainter.PixmapFragment.create(center, source, scale, scale, 0, alpha * opacity)
+            )
+        
+        for button_name, fragments in batches.items():
+            painter.drawPixmapFragments(fragments, sprites[button_name])
+
+
+def describe_screens() -> List[tuple]:
+    """Return (name, width, height) for each connected screen, in Qt's order."""
+    described = []
+    for i, screen in enumerate(QApplication.screens()):
+        size = screen.size()
+        described.append((screen.name() or f"Screen {i + 1}", size.width(), size.height()))
+    return described
 
 
 class SettingsDialog(QDialog):
     """Configuration dialog for KeyVisualizer."""
     
-    def __init__(self, config: dict, parent=None):
+    # Tab indices, in the order the tabs are added
+    APPEARANCE_TAB = 0
+    BEHAVIOR_TAB = 1
+    CLICK_SPOT_TAB = 3
+    
+    # Installed font families, shared by every dialog instance
+    _shared_font_model: Optional[QStringListModel] = None
+    
+    def __init__(self, config: dict, screens: Optional[List[tuple]] = None, parent=None):
         super().__init__(parent)
         self.config = config.copy()
+        # (name, width, height) per screen; the app passes its cached list
+        self.screens = screens if screens is not None else describe_screens()
         self.setWindowTitle("KeyVisualizer Settings")
         self.setMinimumWidth(500)
-        self.setup_ui()
+        # Slider drags fire valueChanged per step; relabel at most every 30 ms
+        self._update_slider_labels_throttled = Throttler(self._update_slider_labels, 30, self)
+        # No layout or paint passes while the widgets are being added
+        self.setUpdatesEnabled(False)
+        try:
+            self.setup_ui()
+        finally:
+            self.setUpdatesEnabled(True)
     
     def setup_ui(self):
         layout = QVBoxLayout(self)
         
-        # Tab widget for organized settings
-        tabs = QTabWidget()
+        # Tab widget for organized settings. Tabs start as empty pages and are
+        # filled in on first visit, so opening the dialog only builds the
+        # current tab.
+        self.tabs = QTabWidget()
+        self._tab_builders = [
+            self._build_appearance_tab,
+            self._build_behavior_tab,
+            self._build_presets_tab,
+            self._build_click_spot_tab,
+        ]
+        self._built_tabs = set()
+        # (config key, widget getter) for every control built so far
+        self._field_getters: List[tuple] = []
+        for title in ("Appearance", "Behavior", "Presets", "Click Spot"):
+            self.tabs.addTab(QWidget(), title)
+        self._ensure_tab_built(self.tabs.currentIndex())
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
+        
+        layout.addWidget(self.tabs)
+        
+        # Dialog buttons
+        btn_layout = QHBoxLayout()
+        btn_layout.addStretch()
+        
+        ok_btn = QPushButton("OK")
+        ok_btn.setDefault(True)
+        ok_btn.clicked.connect(self.accept)
+        btn_layout.addWidget(ok_btn)
+        
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.clicked.connect(self.reject)
+        btn_layout.addWidget(cancel_btn)
         
-        # Appearance tab
-        appearance_tab = QWidget()
-        appearance_layout = QVBoxLayout(appearance_tab)
+        layout.addLayout(btn_layout)
+    
+    @classmethod
+    def _font_model(cls) -> QStringListModel:
+        """Font family list, scanned once and refreshed when fonts change."""
+        if cls._shared_font_model is None:
+            app = QApplication.instance()
+            model = QStringListModel(QFontDatabase.families(), app)
+            app.fontDatabaseChanged.connect(lambda: cls._refresh_font_model(model))
+            cls._shared_font_model = model
+        return cls._shared_font_model
+    
+    @staticmethod
+    def _refresh_font_model(model: QStringListModel):
+        """Apply font installs/removals row by row.
+        
+        setStringList() would reset the model and clear the selection of
+        every open font combo; row inserts and removals keep it.
+        """
+        families = QFontDatabase.families()
+        wanted = set(families)
+        old = model.stringList()
+        for row in reversed(range(len(old))):
+            if old[row] not in wanted:
+                model.removeRows(row, 1)
+        # What's left is in the new order, so each missing name goes at its index
+        present = set(model.stringList())
+        for row, family in enumerate(families):
+            if family not in present:
+                model.insertRows(row, 1)
+                model.setData(model.index(row), family)
+    
+    @pyqtSlot(int)
+    def _ensure_tab_built(self, index: int):
+        """Populate a tab's page the first time it is shown."""
+        if index < 0 or index in self._built_tabs:
+            return
+        self._built_tabs.add(index)
+        page = self.tabs.widget(index)
+        page.setUpdatesEnabled(False)
+        try:
+            self._tab_builders[index](page)
+        finally:
+            page.setUpdatesEnabled(True)
+    
+    def _build_appearance_tab(self, tab: QWidget):
+        """Colors, font and bubble size."""
+        config = self.config
+        appearance_layout = QVBoxLayout(tab)
+        appearance_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         
         # Colors group
         colors_group = QGroupBox("Colors")
@@ -857,29 +1186,32 @@ class SettingsDialog(QDialog):
         colors_layout.addWidget(QLabel("Background:"), 0, 0)
         self.bg_color_btn = QPushButton()
         self.bg_color_btn.setFixedSize(80, 30)
-        self.update_color_button(self.bg_color_btn, self.config['bg_color'])
-        self.bg_color_btn.clicked.connect(lambda: self.pick_color('bg_color', self.bg_color_btn))
-        colors_layout.addWidget(self.bg_color_btn, 0, 1)
+        self.update_color_button(self.bg_color_btn, config['bg_color'])
+        self.bg_color_btn.setProperty('config_key', 'bg_color')
+        self.bg_color_btn.clicked.connect(self._on_swatch_clicked)
+        colors_layout.addWidget(self._outlined(self.bg_color_btn), 0, 1)
         
         # Text color
         colors_layout.addWidget(QLabel("Text:"), 0, 2)
         self.text_color_btn = QPushButton()
         self.text_color_btn.setFixedSize(80, 30)
-        self.update_color_button(self.text_color_btn, self.config['text_color'])
-        self.text_color_btn.clicked.connect(lambda: self.pick_color('text_color', self.text_color_btn))
-        colors_layout.addWidget(self.text_color_btn, 0, 3)
+        self.update_color_button(self.text_color_btn, config['text_color'])
+        self.text_color_btn.setProperty('config_key', 'text_color')
+        self.text_color_btn.clicked.connect(self._on_swatch_clicked)
+        colors_layout.addWidget(self._outlined(self.text_color_btn), 0, 3)
         
         # Border color
         colors_layout.addWidget(QLabel("Border:"), 1, 0)
         self.border_color_btn = QPushButton()
         self.border_color_btn.setFixedSize(80, 30)
-        self.update_color_button(self.border_color_btn, self.config['border_color'])
-        self.border_color_btn.clicked.connect(lambda: self.pick_color('border_color', self.border_color_btn))
-        colors_layout.addWidget(self.border_color_btn, 1, 1)
+        self.update_color_button(self.border_color_btn, config['border_color'])
+        self.border_color_btn.setProperty('config_key', 'border_color')
+        self.border_color_btn.clicked.connect(self._on_swatch_clicked)
+        colors_layout.addWidget(self._outlined(self.border_color_btn), 1, 1)
         
         # Show border checkbox
         self.show_border_cb = QCheckBox("Show border")
-        self.show_border_cb.setChecked(self.config['show_border'])
+        self.show_border_cb.setChecked(config['show_border'])
         colors_layout.addWidget(self.show_border_cb, 1, 2, 1, 2)
         
         appearance_layout.addWidget(colors_group)
@@ -889,18 +1221,20 @@ class SettingsDialog(QDialog):
         font_layout = QGridLayout(font_group)
         
         font_layout.addWidget(QLabel("Family:"), 0, 0)
-        self.font_combo = QFontComboBox()
-        self.font_combo.setCurrentFont(QFont(self.config['font_family']))
+        self.font_combo = QComboBox()
+        self.font_combo.setModel(self._font_model())
+        # Left unselected if the family isn't installed; get_config keeps it
+        self.font_combo.setCurrentIndex(self.font_combo.findText(config['font_family']))
         font_layout.addWidget(self.font_combo, 0, 1, 1, 3)
         
         font_layout.addWidget(QLabel("Size:"), 1, 0)
         self.font_size_spin = QSpinBox()
         self.font_size_spin.setRange(8, 72)
-        self.font_size_spin.setValue(self.config['font_size'])
+        self.font_size_spin.setValue(config['font_size'])
         font_layout.addWidget(self.font_size_spin, 1, 1)
         
         self.font_bold_cb = QCheckBox("Bold")
-        self.font_bold_cb.setChecked(self.config['font_bold'])
+        self.font_bold_cb.setChecked(config['font_bold'])
         font_layout.addWidget(self.font_bold_cb, 1, 2)
         
         appearance_layout.addWidget(font_group)
@@ -912,35 +1246,45 @@ class SettingsDialog(QDialog):
         size_layout.addWidget(QLabel("Padding:"), 0, 0)
         self.padding_spin = QSpinBox()
         self.padding_spin.setRange(4, 40)
-        self.padding_spin.setValue(self.config['padding'])
+        self.padding_spin.setValue(config['padding'])
         size_layout.addWidget(self.padding_spin, 0, 1)
         
         size_layout.addWidget(QLabel("Min Width:"), 0, 2)
         self.min_width_spin = QSpinBox()
         self.min_width_spin.setRange(20, 200)
-        self.min_width_spin.setValue(self.config['min_bubble_width'])
+        self.min_width_spin.setValue(config['min_bubble_width'])
         size_layout.addWidget(self.min_width_spin, 0, 3)
         
         size_layout.addWidget(QLabel("Border Radius:"), 1, 0)
         self.radius_spin = QSpinBox()
         self.radius_spin.setRange(0, 100)  # Allow larger radius for big fonts
-        self.radius_spin.setValue(self.config['border_radius'])
+        self.radius_spin.setValue(config['border_radius'])
         size_layout.addWidget(self.radius_spin, 1, 1)
         
         size_layout.addWidget(QLabel("Border Width:"), 1, 2)
         self.border_width_spin = QSpinBox()
         self.border_width_spin.setRange(1, 10)
-        self.border_width_spin.setValue(self.config['border_width'])
+        self.border_width_spin.setValue(config['border_width'])
         size_layout.addWidget(self.border_width_spin, 1, 3)
         
         appearance_layout.addWidget(size_group)
-        appearance_layout.addStretch()
-        
-        tabs.addTab(appearance_tab, "Appearance")
         
-        # Behavior tab
-        behavior_tab = QWidget()
-        behavior_layout = QVBoxLayout(behavior_tab)
+        self._field_getters += [
+            ('show_border', self.show_border_cb.isChecked),
+            ('font_family', lambda: self.font_combo.currentText() or config['font_family']),
+            ('font_size', self.font_size_spin.value),
+            ('font_bold', self.font_bold_cb.isChecked),
+            ('padding', self.padding_spin.value),
+            ('min_bubble_width', self.min_width_spin.value),
+            ('border_radius', self.radius_spin.value),
+            ('border_width', self.border_width_spin.value),
+        ]
+    
+    def _build_behavior_tab(self, tab: QWidget):
+        """Position, animation and startup options."""
+        config = self.config
+        behavior_layout = QVBoxLayout(tab)
+        behavior_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         
         # Position group
         position_group = QGroupBox("Position")
@@ -952,7 +1296,7 @@ class SettingsDialog(QDialog):
         self.h_pos_combo.addItem("Left", "left")
         self.h_pos_combo.addItem("Center", "center")
         self.h_pos_combo.addItem("Right", "right")
-        current_h = self.config.get('position_horizontal', 'center')
+        current_h = config['position_horizontal']
         self.h_pos_combo.setCurrentIndex({'left': 0, 'center': 1, 'right': 2}.get(current_h, 1))
         position_layout.addWidget(self.h_pos_combo, 0, 1)
         
@@ -961,7 +1305,7 @@ class SettingsDialog(QDialog):
         self.v_pos_combo = QComboBox()
         self.v_pos_combo.addItem("Top", "top")
         self.v_pos_combo.addItem("Bottom", "bottom")
-        current_v = self.config.get('position_vertical', 'bottom')
+        current_v = config['position_vertical']
         self.v_pos_combo.setCurrentIndex({'top': 0, 'bottom': 1}.get(current_v, 1))
         position_layout.addWidget(self.v_pos_combo, 0, 3)
         
@@ -970,14 +1314,12 @@ class SettingsDialog(QDialog):
         self.screen_combo = QComboBox()
         
         # Populate with available screens
-        screens = QApplication.screens()
         self.screen_combo.addItem("Primary Screen", "primary")
-        for i, screen in enumerate(screens):
-            screen_name = screen.name() if screen.name() else f"Screen {i + 1}"
-            self.screen_combo.addItem(f"{screen_name} ({screen.size().width()}x{screen.size().height()})", f"screen_{i}")
+        for i, (screen_name, width, height) in enumerate(self.screens):
+            self.screen_combo.addItem(f"{screen_name} ({width}x{height})", f"screen_{i}")
         
         # Set current selection
-        current_screen = self.config.get('screen_selection', 'primary')
+        current_screen = config['screen_selection']
         for i in range(self.screen_combo.count()):
             if self.screen_combo.itemData(i) == current_screen:
                 self.screen_combo.setCurrentIndex(i)
@@ -989,27 +1331,27 @@ class SettingsDialog(QDialog):
         position_layout.addWidget(QLabel("Vertical Margin:"), 2, 0)
         self.margin_spin = QSpinBox()
         self.margin_spin.setRange(0, 500)
-        self.margin_spin.setValue(self.config['margin_bottom'])
+        self.margin_spin.setValue(config['margin_bottom'])
         position_layout.addWidget(self.margin_spin, 2, 1)
         
         position_layout.addWidget(QLabel("Horizontal Offset:"), 2, 2)
         self.h_margin_spin = QSpinBox()
         self.h_margin_spin.setRange(-500, 500)
-        self.h_margin_spin.setValue(self.config.get('margin_horizontal', 0))
+        self.h_margin_spin.setValue(config['margin_horizontal'])
         position_layout.addWidget(self.h_margin_spin, 2, 3)
         
         # Size settings (overlay height auto-adjusts with font size)
         position_layout.addWidget(QLabel("Min Height:"), 3, 0)
         self.height_spin = QSpinBox()
         self.height_spin.setRange(40, 300)
-        self.height_spin.setValue(self.config['overlay_height'])
+        self.height_spin.setValue(config['overlay_height'])
         self.height_spin.setToolTip("Minimum overlay height (auto-adjusts based on font size)")
         position_layout.addWidget(self.height_spin, 3, 1)
         
         position_layout.addWidget(QLabel("Bubble Spacing:"), 3, 2)
         self.spacing_spin = QSpinBox()
         self.spacing_spin.setRange(2, 50)
-        self.spacing_spin.setValue(self.config['bubble_spacing'])
+        self.spacing_spin.setValue(config['bubble_spacing'])
         position_layout.addWidget(self.spacing_spin, 3, 3)
         
         behavior_layout.addWidget(position_group)
@@ -1021,16 +1363,16 @@ class SettingsDialog(QDialog):
         anim_layout.addWidget(QLabel("Fade Speed:"), 0, 0)
         self.fade_slider = QSlider(Qt.Orientation.Horizontal)
         self.fade_slider.setRange(1, 20)
-        self.fade_slider.setValue(int(self.config['fade_speed'] * 10))
+        self.fade_slider.setValue(int(config['fade_speed'] * 10))
         anim_layout.addWidget(self.fade_slider, 0, 1)
-        self.fade_label = QLabel(f"{self.config['fade_speed']:.1f}")
-        self.fade_slider.valueChanged.connect(lambda v: self.fade_label.setText(f"{v/10:.1f}"))
+        self.fade_label = QLabel(f"{config['fade_speed']:.1f}")
+        self.fade_slider.valueChanged.connect(self._update_slider_labels_throttled)
         anim_layout.addWidget(self.fade_label, 0, 2)
         
         anim_layout.addWidget(QLabel("Max Keys Shown:"), 1, 0)
         self.max_keys_spin = QSpinBox()
         self.max_keys_spin.setRange(1, 20)
-        self.max_keys_spin.setValue(self.config['max_keys'])
+        self.max_keys_spin.setValue(config['max_keys'])
         anim_layout.addWidget(self.max_keys_spin, 1, 1)
         
         behavior_layout.addWidget(anim_group)
@@ -1040,21 +1382,33 @@ class SettingsDialog(QDialog):
         startup_layout = QVBoxLayout(startup_group)
         
         self.start_minimized_cb = QCheckBox("Start minimized to tray")
-        self.start_minimized_cb.setChecked(self.config.get('start_minimized', True))
+        self.start_minimized_cb.setChecked(config['start_minimized'])
         startup_layout.addWidget(self.start_minimized_cb)
         
         self.autostart_cb = QCheckBox("Start with Windows")
-        self.autostart_cb.setChecked(self.config.get('autostart', False))
+        self.autostart_cb.setChecked(config['autostart'])
         startup_layout.addWidget(self.autostart_cb)
         
         behavior_layout.addWidget(startup_group)
-        behavior_layout.addStretch()
-        
-        tabs.addTab(behavior_tab, "Behavior")
         
-        # Presets tab
-        presets_tab = QWidget()
-        presets_layout = QVBoxLayout(presets_tab)
+        self._field_getters += [
+            ('overlay_height', self.height_spin.value),
+            ('margin_bottom', self.margin_spin.value),
+            ('margin_horizontal', self.h_margin_spin.value),
+            ('bubble_spacing', self.spacing_spin.value),
+            ('fade_speed', lambda: self.fade_slider.value() / 10.0),
+            ('max_keys', self.max_keys_spin.value),
+            ('start_minimized', self.start_minimized_cb.isChecked),
+            ('autostart', self.autostart_cb.isChecked),
+            ('position_horizontal', self.h_pos_combo.currentData),
+            ('position_vertical', self.v_pos_combo.currentData),
+            ('screen_selection', self.screen_combo.currentData),
+        ]
+    
+    def _build_presets_tab(self, tab: QWidget):
+        """Quick color presets."""
+        presets_layout = QVBoxLayout(tab)
+        presets_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         
         presets_group = QGroupBox("Quick Presets")
         presets_btn_layout = QVBoxLayout(presets_group)
@@ -1076,97 +1430,109 @@ class SettingsDialog(QDialog):
         presets_btn_layout.addWidget(colorful_btn)
         
         presets_layout.addWidget(presets_group)
-        presets_layout.addStretch()
-        
-        tabs.addTab(presets_tab, "Presets")
-        
-        # Click Spot tab
-        click_spot_tab = QWidget()
-        click_spot_layout = QVBoxLayout(click_spot_tab)
+    
+    def _build_click_spot_tab(self, tab: QWidget):
+        """Click spot overlay options."""
+        config = self.config
+        click_spot_layout = QVBoxLayout(tab)
+        click_spot_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         
         click_spot_group = QGroupBox("Click spot (circle at click position)")
         cs_layout = QGridLayout(click_spot_group)
         
         self.show_click_spot_cb = QCheckBox("Show click spot")
-        self.show_click_spot_cb.setChecked(self.config.get('show_click_spot', True))
+        self.show_click_spot_cb.setChecked(config['show_click_spot'])
         cs_layout.addWidget(self.show_click_spot_cb, 0, 0, 1, 2)
         
         cs_layout.addWidget(QLabel("Radius:"), 1, 0)
         self.click_spot_radius_spin = QSpinBox()
         self.click_spot_radius_spin.setRange(10, 120)
-        self.click_spot_radius_spin.setValue(self.config.get('click_spot_radius', 45))
+        self.click_spot_radius_spin.setValue(config['click_spot_radius'])
         cs_layout.addWidget(self.click_spot_radius_spin, 1, 1)
         
         cs_layout.addWidget(QLabel("Fade (ms):"), 1, 2)
         self.click_spot_fade_spin = QSpinBox()
         self.click_spot_fade_spin.setRange(100, 1500)
-        self.click_spot_fade_spin.setValue(self.config.get('click_spot_fade_ms', 400))
+        self.click_spot_fade_spin.setValue(config['click_spot_fade_ms'])
         self.click_spot_fade_spin.setSuffix(" ms")
         cs_layout.addWidget(self.click_spot_fade_spin, 1, 3)
         
         cs_layout.addWidget(QLabel("Center opacity:"), 2, 0)
         self.click_spot_opacity_slider = QSlider(Qt.Orientation.Horizontal)
         self.click_spot_opacity_slider.setRange(10, 100)
-        self.click_spot_opacity_slider.setValue(int(self.config.get('click_spot_opacity', 0.7) * 100))
+        self.click_spot_opacity_slider.setValue(int(config['click_spot_opacity'] * 100))
         cs_layout.addWidget(self.click_spot_opacity_slider, 2, 1)
-        self.click_spot_opacity_label = QLabel(f"{self.config.get('click_spot_opacity', 0.7):.2f}")
-        self.click_spot_opacity_slider.valueChanged.connect(
-            lambda v: self.click_spot_opacity_label.setText(f"{v/100:.2f}")
-        )
+        self.click_spot_opacity_label = QLabel(f"{config['click_spot_opacity']:.2f}")
+        self.click_spot_opacity_slider.valueChanged.connect(self._update_slider_labels_throttled)
         cs_layout.addWidget(self.click_spot_opacity_label, 2, 2)
         
         cs_layout.addWidget(QLabel("Left click color:"), 3, 0)
         self.click_spot_left_btn = QPushButton()
         self.click_spot_left_btn.setFixedSize(80, 28)
-        self.update_color_button(self.click_spot_left_btn, self.config.get('click_spot_color_left', '#6490ff'))
-        self.click_spot_left_btn.clicked.connect(lambda: self.pick_color('click_spot_color_left', self.click_spot_left_btn))
-        cs_layout.addWidget(self.click_spot_left_btn, 3, 1)
+        self.update_color_button(self.click_spot_left_btn, config['click_spot_color_left'])
+        self.click_spot_left_btn.setProperty('config_key', 'click_spot_color_left')
+        self.click_spot_left_btn.clicked.connect(self._on_swatch_clicked)
+        cs_layout.addWidget(self._outlined(self.click_spot_left_btn), 3, 1)
         
         cs_layout.addWidget(QLabel("Right click color:"), 3, 2)
         self.click_spot_right_btn = QPushButton()
         self.click_spot_right_btn.setFixedSize(80, 28)
-        self.update_color_button(self.click_spot_right_btn, self.config.get('click_spot_color_right', '#ff7864'))
-        self.click_spot_right_btn.clicked.connect(lambda: self.pick_color('click_spot_color_right', self.click_spot_right_btn))
-        cs_layout.addWidget(self.click_spot_right_btn, 3, 3)
+        self.update_color_button(self.click_spot_right_btn, config['click_spot_color_right'])
+        self.click_spot_right_btn.setProperty('config_key', 'click_spot_color_right')
+        self.click_spot_right_btn.clicked.connect(self._on_swatch_clicked)
+        cs_layout.addWidget(self._outlined(self.click_spot_right_btn), 3, 3)
         
         cs_layout.addWidget(QLabel("Middle click color:"), 4, 0)
         self.click_spot_middle_btn = QPushButton()
         self.click_spot_middle_btn.setFixedSize(80, 28)
-        self.update_color_button(self.click_spot_middle_btn, self.config.get('click_spot_color_middle', '#8cc88c'))
-        self.click_spot_middle_btn.clicked.connect(lambda: self.pick_color('click_spot_color_middle', self.click_spot_middle_btn))
-        cs_layout.addWidget(self.click_spot_middle_btn, 4, 1)
+        self.update_color_button(self.click_spot_middle_btn, config['click_spot_color_middle'])
+        self.click_spot_middle_btn.setProperty('config_key', 'click_spot_color_middle')
+        self.click_spot_middle_btn.clicked.connect(self._on_swatch_clicked)
+        cs_layout.addWidget(self._outlined(self.click_spot_middle_btn), 4, 1)
         
         click_spot_layout.addWidget(click_spot_group)
-        click_spot_layout.addStretch()
-        
-        tabs.addTab(click_spot_tab, "Click Spot")
-        
-        layout.addWidget(tabs)
-        
-        # Dialog buttons
-        btn_layout = QHBoxLayout()
-        btn_layout.addStretch()
-        
-        ok_btn = QPushButton("OK")
-        ok_btn.setDefault(True)
-        ok_btn.clicked.connect(self.accept)
-        btn_layout.addWidget(ok_btn)
         
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.clicked.connect(self.reject)
-        btn_layout.addWidget(cancel_btn)
-        
-        layout.addLayout(btn_layout)
+        self._field_getters += [
+            ('show_click_spot', self.show_click_spot_cb.isChecked),
+            ('click_spot_radius', self.click_spot_radius_spin.value),
+            ('click_spot_fade_ms', self.click_spot_fade_spin.value),
+            ('click_spot_opacity', lambda: self.click_spot_opacity_slider.value() / 100.0),
+        ]
+    
+    def _update_slider_labels(self):
+        """Show the current slider values next to the sliders."""
+        if self.BEHAVIOR_TAB in self._built_tabs:
+            self.fade_label.setText(f"{self.fade_slider.value()/10:.1f}")
+        if self.CLICK_SPOT_TAB in self._built_tabs:
+            self.click_spot_opacity_label.setText(f"{self.click_spot_opacity_slider.value()/100:.2f}")
     
     def update_color_button(self, button: QPushButton, color: str):
         """Update button appearance with color preview."""
-        button.setStyleSheet(f"""
-            QPushButton {{
-                background-color: {color};
-                border: 1px solid #555;
-                border-radius: 4px;
-            }}
-        """)
+        # A palette swap avoids re-parsing a stylesheet and re-polishing
+        if not button.isFlat():
+            button.setFlat(True)
+            button.setAutoFillBackground(True)
+        palette = button.palette()
+        palette.setColor(QPalette.ColorRole.Button, QColor(color))
+        button.setPalette(palette)
+    
+    @staticmethod
+    def _outlined(button: QPushButton) -> QFrame:
+        """Wrap a swatch in a 1px outline so white or dark fills keep an edge."""
+        frame = QFrame()
+        frame.setFrameShape(QFrame.Shape.Box)
+        frame.setFrameShadow(QFrame.Shadow.Plain)
+        frame_layout = QVBoxLayout(frame)
+        frame_layout.setContentsMargins(0, 0, 0, 0)
+        frame_layout.addWidget(button)
+        frame.setFixedSize(frame.sizeHint())
+        return frame
+    
+    @pyqtSlot()
+    def _on_swatch_clicked(self):
+        """Shared click handler for all color swatches."""
+        button = self.sender()
+        self.pick_color(button.property('config_key'), button)
     
     def pick_color(self, config_key: str, button: QPushButton):
         """Open color picker dialog."""
@@ -1176,6 +1542,7 @@ class SettingsDialog(QDialog):
             self.config[config_key] = color.name()
             self.update_color_button(button, color.name())
     
+    @pyqtSlot()
     def apply_dark_preset(self):
         """Apply dark theme preset."""
         self.config.update({
@@ -1186,6 +1553,7 @@ class SettingsDialog(QDialog):
         })
         self.refresh_color_buttons()
     
+    @pyqtSlot()
     def apply_light_preset(self):
         """Apply light theme preset."""
         self.config.update({
@@ -1196,6 +1564,7 @@ class SettingsDialog(QDialog):
         })
         self.refresh_color_buttons()
     
+    @pyqtSlot()
     def apply_minimal_preset(self):
         """Apply minimal preset."""
         self.config.update({
@@ -1206,6 +1575,7 @@ class SettingsDialog(QDialog):
         })
         self.refresh_color_buttons()
     
+    @pyqtSlot()
     def apply_colorful_preset(self):
         """Apply colorful preset."""
         self.config.update({
@@ -1218,48 +1588,30 @@ class SettingsDialog(QDialog):
     
     def refresh_color_buttons(self):
         """Update all color buttons after preset change."""
-        self.update_color_button(self.bg_color_btn, self.config['bg_color'])
-        self.update_color_button(self.text_color_btn, self.config['text_color'])
-        self.update_color_button(self.border_color_btn, self.config['border_color'])
-        self.show_border_cb.setChecked(self.config['show_border'])
+        if self.APPEARANCE_TAB not in self._built_tabs:
+            return  # The tab reads self.config when it is first shown
+        config = self.config
+        self.update_color_button(self.bg_color_btn, config['bg_color'])
+        self.update_color_button(self.text_color_btn, config['text_color'])
+        self.update_color_button(self.border_color_btn, config['border_color'])
+        self.show_border_cb.setChecked(config['show_border'])
     
     def get_config(self) -> dict:
         """Return updated configuration."""
-        return {
-            'bg_color': self.config['bg_color'],
-            'text_color': self.config['text_color'],
-            'border_color': self.config['border_color'],
-            'show_border': self.show_border_cb.isChecked(),
-            'font_family': self.font_combo.currentFont().family(),
-            'font_size': self.font_size_spin.value(),
-            'font_bold': self.font_bold_cb.isChecked(),
-            'padding': self.padding_spin.value(),
-            'min_bubble_width': self.min_width_spin.value(),
-            'border_radius': self.radius_spin.value(),
-            'border_width': self.border_width_spin.value(),
-            'overlay_height': self.height_spin.value(),
-            'margin_bottom': self.margin_spin.value(),
-            'margin_horizontal': self.h_margin_spin.value(),
-            'bubble_spacing': self.spacing_spin.value(),
-            'fade_speed': self.fade_slider.value() / 10.0,
-            'max_keys': self.max_keys_spin.value(),
-            'start_minimized': self.start_minimized_cb.isChecked(),
-            'autostart': self.autostart_cb.isChecked(),
-            'position_horizontal': self.h_pos_combo.currentData(),
-            'position_vertical': self.v_pos_combo.currentData(),
-            'screen_selection': self.screen_combo.currentData(),
-            'show_click_spot': self.show_click_spot_cb.isChecked(),
-            'click_spot_radius': self.click_spot_radius_spin.value(),
-            'click_spot_fade_ms': self.click_spot_fade_spin.value(),
-            'click_spot_color_left': self.config.get('click_spot_color_left', '#6490ff'),
-            'click_spot_color_right': self.config.get('click_spot_color_right', '#ff7864'),
-            'click_spot_color_middle': self.config.get('click_spot_color_middle', '#8cc88c'),
-            'click_spot_opacity': self.click_spot_opacity_slider.value() / 100.0,
-        }
+        # Tabs that were never opened registered no getters and keep the
+        # values passed in
+        return {**self.config, **{key: getter() for key, getter in self._field_getters}}
+
+
+_TRAY_ICON_CACHE: Optional[QIcon] = None
 
 
 def create_tray_icon() -> QIcon:
-    """Create the system tray icon."""
+    """Create the system tray icon (rendered once, then reused)."""
+    global _TRAY_ICON_CACHE
+    if _TRAY_ICON_CACHE is not None:
+        return _TRAY_ICON_CACHE
+    
     size = 64
     img = QImage(size, size, QImage.Format.Format_ARGB32)
     img.fill(Qt.GlobalColor.transparent)
@@ -1278,7 +1630,8 @@ def create_tray_icon() -> QIcon:
     painter.drawText(img.rect(), Qt.AlignmentFlag.AlignCenter, "K")
     
     painter.end()
-    return QIcon(QPixmap.fromImage(img))
+    _TRAY_ICON_CACHE = QIcon(QPixmap.fromImage(img))
+    return _TRAY_ICON_CACHE
 
 
 class KeyVisualizerApp(QSystemTrayIcon):
@@ -1324,15 +1677,26 @@ class KeyVisualizerApp(QSystemTrayIcon):
         self.settings = QSettings("StuckAtPrototype", "KeyVisualizer")
         self.config = self.load_config()
         
+        # Screen list for the settings dialog, refreshed only when monitors
+        # are added/removed or change resolution/scaling
+        self._screen_cache: List[tuple] = []
+        qt_app = QApplication.instance()
+        for screen in qt_app.screens():
+            screen.geometryChanged.connect(self._rebuild_screen_cache)
+        self._rebuild_screen_cache()
+        qt_app.screenAdded.connect(self._on_screen_added)
+        qt_app.screenRemoved.connect(self._rebuild_screen_cache)
+        
         # State
         self.is_active = True
-        self.keyboard_listener = KeyboardListener()
-        self.mouse_listener = MouseClickListener()
+        # Both hooks feed one queue drained on the GUI thread
+        self.input_queue = InputEventQueue()
+        self.keyboard_listener = KeyboardListener(self.input_queue)
+        self.mouse_listener = MouseClickListener(self.input_queue)
         
-        # Create overlays
-        self.overlay = KeyOverlay(self.config)
-        self.click_spot_overlay = ClickSpotOverlay(self.config)
-        self.click_spot_overlay.update_geometry()
+        # Overlays are created on the first key/click that needs them
+        self.overlay: Optional[KeyOverlay] = None
+        self.click_spot_overlay: Optional[ClickSpotOverlay] = None
         
         # Setup UI
         self.setup_tray()
@@ -1346,31 +1710,83 @@ class KeyVisualizerApp(QSystemTrayIcon):
         self.mouse_listener.click_pressed.connect(self.on_click_pressed)
         self.mouse_listener.click_released.connect(self.on_click_released)
         
-        # Start listening (show click spot first so key overlay stays on top)
+        # Start listening
         self.keyboard_listener.start()
         self.mouse_listener.start()
-        if self.config.get('show_click_spot', True):
+    
+    def _ensure_overlay(self) -> KeyOverlay:
+        """Create and show the key overlay on first use."""
+        if self.overlay is None:
+            self.overlay = KeyOverlay(self.config)
+            self.overlay.show()
+        return self.overlay
+    
+    def _ensure_click_spot_overlay(self) -> ClickSpotOverlay:
+        """Create and show the click spot overlay on first use."""
+        if self.click_spot_overlay is None:
+            self.click_spot_overlay = ClickSpotOverlay(self.config)
+            self.click_spot_overlay.update_geometry()
             self.click_spot_overlay.show()
-        self.overlay.show()
-        self.overlay.raise_()
+            # Keep the key overlay on top of the full-screen spot layer
+            if self.overlay is not None:
+                self.overlay.raise_()
+        return self.click_spot_overlay
+    
+    @pyqtSlot()
+    def _rebuild_screen_cache(self):
+        """Snapshot the connected screens.
+        
+        Called on screenRemoved, on screenAdded (via _on_screen_added) and on
+        each screen's geometryChanged.
+        """
+        self._screen_cache = describe_screens()
+    
+    @pyqtSlot(QScreen)
+    def _on_screen_added(self, screen: QScreen):
+        """Track a new monitor's resolution changes and refresh the list."""
+        screen.geometryChanged.connect(self._rebuild_screen_cache)
+        self._rebuild_screen_cache()
     
     def load_config(self) -> dict:
         """Load configuration from settings."""
         config = self.DEFAULT_CONFIG.copy()
         
-        stored = self.settings.value("config")
-        if stored:
+        # Older versions stored the whole config as one JSON string
+        legacy = self.settings.value("config")
+        if isinstance(legacy, str):
             try:
-                stored_config = json.loads(stored)
-                config.update(stored_config)
+                config.update(json.loads(legacy))
             except (json.JSONDecodeError, TypeError):
                 pass
+            self.settings.remove("config")
+            self._write_config(config)
+            return config
+        
+        self.settings.beginGroup("config")
+        for key in self.settings.allKeys():
+            default = self.DEFAULT_CONFIG.get(key)
+            try:
+                if default is None:
+                    config[key] = self.settings.value(key)
+                else:
+                    # INI/registry backends hand bools and numbers back as strings
+                    config[key] = self.settings.value(key, default, type=type(default))
+            except TypeError:
+                pass
+        self.settings.endGroup()
         
         return config
     
     def save_config(self):
         """Save configuration to settings."""
-        self.settings.setValue("config", json.dumps(self.config))
+        self._write_config(self.config)
+    
+    def _write_config(self, config: dict):
+        """Store each config entry as its own key under the "config" group."""
+        self.settings.beginGroup("config")
+        for key, value in config.items():
+            self.settings.setValue(key, value)
+        self.settings.endGroup()
     
     def setup_tray(self):
         """Setup system tray icon and menu."""
@@ -1417,79 +1833,112 @@ class KeyVisualizerApp(QSystemTrayIcon):
         if reason == QSystemTrayIcon.ActivationReason.DoubleClick:
             self.show_settings()
     
+    @pyqtSlot()
     def toggle_active(self):
         """Toggle key visualization on/off."""
         self.is_active = not self.is_active
         
         if self.is_active:
-            if self.config.get('show_click_spot', True):
-                self.click_spot_overlay.show()
-            self.overlay.show()
-            self.overlay.raise_()
+            # Only touch the windows that actually change state; the key
+            # overlay needs re-raising only when something was just shown
+            # Overlays not created yet appear on the next key/click
+            restacked = False
+            spots = self.click_spot_overlay
+            if spots is not None and self.config.get('show_click_spot', True) and not spots.isVisible():
+                spots.show()
+                restacked = True
+            if self.overlay is not None and not self.overlay.isVisible():
+                self.overlay.show()
+                restacked = True
+            if restacked and self.overlay is not None:
+                self.overlay.raise_()
             self.toggle_action.setText("Pause")
             self.status_action.setText("Active")
             self.setToolTip("KeyVisualizer - Active\nRight-click for menu")
         else:
-            self.overlay.hide()
-            self.click_spot_overlay.hide()
+            for overlay in (self.overlay, self.click_spot_overlay):
+                if overlay is not None and overlay.isVisible():
+                    overlay.hide()
             self.toggle_action.setText("Resume")
             self.status_action.setText("Paused")
             self.setToolTip("KeyVisualizer - Paused\nRight-click for menu")
     
+    @pyqtSlot(str)
     def on_key_pressed(self, key_name: str):
         """Handle key press event."""
         if self.is_active:
-            self.overlay.add_key(key_name)
+            self._ensure_overlay().add_key(key_name)
     
+    @pyqtSlot(str)
     def on_key_released(self, key_name: str):
         """Handle key release event."""
-        if self.is_active:
+        if self.is_active and self.overlay is not None:
             self.overlay.release_key(key_name)
     
+    @pyqtSlot(str)
     def on_combo_pressed(self, combo: str):
         """Handle key combination press (e.g., Ctrl+S)."""
         if self.is_active:
             # Remove individual modifier bubbles and show the combo instead
-            self.overlay.show_combo(combo)
+            self._ensure_overlay().show_combo(combo)
     
+    @pyqtSlot(str, float, float)
     def on_click_pressed(self, button_name: str, x: float, y: float):
         """Handle mouse click (Left Click, Right Click, etc.)."""
         if self.is_active:
-            self.overlay.add_key(button_name)
+            self._ensure_overlay().add_key(button_name)
             if self.config.get('show_click_spot', True):
-                self.click_spot_overlay.add_spot(x, y, button_name)
+                self._ensure_click_spot_overlay().add_spot(x, y, button_name)
     
+    @pyqtSlot(str)
     def on_click_released(self, button_name: str):
         """Handle mouse release."""
-        if self.is_active:
+        if self.is_active and self.overlay is not None:
             self.overlay.release_key(button_name)
     
+    @pyqtSlot()
     def show_settings(self):
         """Show settings dialog."""
-        dialog = SettingsDialog(self.config)
+        dialog = SettingsDialog(self.config, self._screen_cache)
         
-        if dialog.exec() == QDialog.DialogCode.Accepted:
-            self.config = dialog.get_config()
-            self.save_config()
-            self.overlay.update_config(self.config)
-            self.click_spot_overlay.update_config(self.config)
-            
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        
+        old_config = self.config
+        self.config = dialog.get_config()
+        changed = {k for k, v in self.config.items() if old_config.get(k) != v}
+        if not changed:
+            return  # Nothing changed: skip the settings write and overlay rebuild
+        
+        self.save_config()
+        if self.overlay is not None:
+            self.overlay.update_config(self.config, changed)
+        spots = self.click_spot_overlay
+        if spots is not None:
+            spots.update_config(self.config, changed)
             # Show/hide click spot overlay based on setting
             if self.config.get('show_click_spot', True):
-                if self.is_active:
-                    self.click_spot_overlay.show()
-            else:
-                self.click_spot_overlay.hide()
-            
-            # Handle autostart
-            if self.config.get('autostart'):
-                self.enable_autostart()
-            else:
-                self.disable_autostart()
+                if self.is_active and not spots.isVisible():
+                    spots.show()
+                    if self.overlay is not None:
+                        self.overlay.raise_()
+            elif spots.isVisible():
+                spots.hide()
+        
+        self._apply_autostart(changed)
+    
+    def _apply_autostart(self, changed: set):
+        """Sync the startup entry, touching the registry only if the setting flipped."""
+        if 'autostart' not in changed:
+            return
+        if self.config.get('autostart'):
+            self.enable_autostart()
+        else:
+            self.disable_autostart()
     
+    @pyqtSlot()
     def reset_to_defaults(self):
         """Reset all settings to default values."""
-        from PyQt6.QtWidgets import QMessageBox
         reply = QMessageBox.question(
             None,
             "Reset to Defaults",
@@ -1498,23 +1947,40 @@ class KeyVisualizerApp(QSystemTrayIcon):
             QMessageBox.StandardButton.No
         )
         
-        if reply == QMessageBox.StandardButton.Yes:
-            # Reset to default config
-            self.config = self.DEFAULT_CONFIG.copy()
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+        
+        # Reset to default config
+        old_config = self.config
+        self.config = self.DEFAULT_CONFIG.copy()
+        changed = {k for k, v in self.config.items() if old_config.get(k) != v}
+        if changed:
             self.save_config()
-            self.overlay.update_config(self.config)
-            
-            QMessageBox.information(
-                None,
-                "Reset Complete",
-                "Settings have been reset to defaults."
-            )
+            self._apply_autostart(changed)
+        
+        QMessageBox.information(
+            None,
+            "Reset Complete",
+            "Settings have been reset to defaults."
+        )
+        
+        # Apply once the message box is gone, so the overlay doesn't redraw
+        # behind it, and repaint a single time after the whole update
+        if not changed:
+            return
+        if self.overlay is not None:
+            self.overlay.setUpdatesEnabled(False)
+            try:
+                self.overlay.update_config(self.config, changed)
+            finally:
+                self.overlay.setUpdatesEnabled(True)
+        if self.click_spot_overlay is not None:
+            self.click_spot_overlay.update_config(self.config, changed)
     
     def enable_autostart(self):
         """Add to Windows startup."""
         if sys.platform != 'win32':
             return
-        import winreg
         try:
             key = winreg.OpenKey(
                 winreg.HKEY_CURRENT_USER,
@@ -1530,7 +1996,6 @@ class KeyVisualizerApp(QSystemTrayIcon):
         """Remove from Windows startup."""
         if sys.platform != 'win32':
             return
-        import winreg
         try:
             key = winreg.OpenKey(
                 winreg.HKEY_CURRENT_USER,
@@ -1542,12 +2007,14 @@ class KeyVisualizerApp(QSystemTrayIcon):
         except Exception:
             pass
     
+    @pyqtSlot()
     def quit_app(self):
         """Clean shutdown."""
         self.keyboard_listener.stop()
         self.mouse_listener.stop()
-        self.overlay.hide()
-        self.click_spot_overlay.hide()
+        for overlay in (self.overlay, self.click_spot_overlay):
+            if overlay is not None:
+                overlay.hide()
         self.save_config()
         QApplication.quit()
 